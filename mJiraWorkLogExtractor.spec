@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=['dateutil.relativedelta'],
+    hiddenimports=['dateutil.relativedelta', 'jira_worklog_extractor.core'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -2,6 +2,21 @@
 jira_worklog_extractor package (src layout)
 
 Single source of truth for library and CLI entrypoint via core.main.
+
+Importing the package is cheap: core (requests, openpyxl, ...) is only loaded
+on first attribute access, e.g. ``from jira_worklog_extractor import main``.
 """
 
-from .core import *  # noqa: F401,F403
+import importlib
+from typing import Any
+
+__all__ = ["main"]
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562 lazy export; also keeps legacy `jira_worklog_extractor.<helper>` access working.
+    core = importlib.import_module(".core", __name__)
+    try:
+        return getattr(core, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
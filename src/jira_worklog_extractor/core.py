@@ -11,39 +11,76 @@ Carries forward v10 features:
 """
 
 import argparse
+import asyncio
 import configparser
+import functools
+import json
+import operator
 import os
+import random
 import re
+import ssl
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
-import pandas as pd
 import requests
 import urllib3
 from dateutil.relativedelta import relativedelta
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:  # optional dependency (pip install .[async]); imported lazily at runtime
+    import httpx
 
 # Optional Windows trust store integration via certifi-win32.
-# Use importlib to detect presence without forcing dependency at import time.
+# Applied lazily by make_session (see _ensure_win_trust), not at import time.
 _WIN_TRUST = False
-if os.name == "nt":
+_WIN_TRUST_CHECKED = False
+
+# Optional C-accelerated ISO-8601 parser; falls back to the stdlib parser.
+_parse_iso: Callable[[str], datetime]
+try:
+    import ciso8601
+    _parse_iso = ciso8601.parse_datetime
+except ImportError:
+    _parse_iso = datetime.fromisoformat
+
+def _accepts_compact_offset(parse: Callable[[str], datetime]) -> bool:
+    """True if parse reads Jira's '+HHMM' offset as is (ciso8601, Python 3.11+)."""
     try:
-        import importlib.util
-        spec = importlib.util.find_spec("certifi_win32")
-        if spec is not None:
-            import importlib
-            importlib.import_module("certifi_win32")  # applies Windows cert store patch
-            _WIN_TRUST = True
-    except Exception:
-        _WIN_TRUST = False
+        parse("2000-01-01T00:00:00.000+0000")
+        return True
+    except ValueError:
+        return False
+
+_ISO_COMPACT_OFFSET_OK = _accepts_compact_offset(_parse_iso)
+
+def _find_fast_loads() -> Optional[Callable[[bytes], Any]]:
+    """Return the fastest installed bytes JSON decoder: orjson, then msgspec; None for the stdlib."""
+    try:
+        import orjson
+        return orjson.loads
+    except ImportError:
+        pass
+    try:
+        import msgspec
+        return msgspec.json.decode
+    except ImportError:
+        return None
+
+# Optional fast JSON decoder used on raw response bytes.
+_fast_loads: Optional[Callable[[bytes], Any]] = _find_fast_loads()
 
 DEFAULT_TZ = timezone.utc
 SOW_FIELD_ID = "customfield_11921"
 
-COLS = [
+COLS = (
     "Projeto",
     "Tipo de Problema",
     "Clave",
@@ -54,9 +91,9 @@ COLS = [
     "Nome de Exibição",
     "Tempo Gasto (h)",
     "Descrição do Trabalho",
-]
+)
 
-SHORT_COLS = [
+SHORT_COLS = (
     "Projeto",
     "Clave",
     "Resumo",
@@ -64,7 +101,17 @@ SHORT_COLS = [
     "Data de Início",
     "Nome de Exibição",
     "Tempo Gasto (h)",
-]
+)
+
+# Projects a COLS-ordered row onto SHORT_COLS in C (operator.itemgetter returns a tuple).
+_SHORT_ROW = operator.itemgetter(*(COLS.index(c) for c in SHORT_COLS))
+
+_NUM_RE = re.compile(r"\d+")
+
+# One report row: a tuple of values in COLS order. Rows go straight from the
+# worklog JSON to the write-only sheet, which consumes them row by row, so a
+# columnar (SoA/Arrow) buffer would only add a transpose before writing.
+Row = Tuple[Any, ...]
 
 def month_bounds(dt: datetime) -> Tuple[datetime, datetime]:
     """Return the month bounds in DEFAULT_TZ for the given datetime.
@@ -106,9 +153,18 @@ def compute_bounds(now_utc: datetime, start_str: str, end_str: str) -> Tuple[dat
     - Safety:
       Ensures end is strictly after start; if not, sets end = start + 1 day.
 
+    The result depends only on now_utc's calendar day, so it is memoized per
+    (day, start_str, end_str) for callers that run main() repeatedly.
+
     Returns:
         tuple[datetime, datetime]: (start, end) timezone-aware datetimes in DEFAULT_TZ.
     """
+    return _compute_bounds_for_day(now_utc.date(), start_str, end_str)
+
+@functools.lru_cache(maxsize=32)
+def _compute_bounds_for_day(today: date, start_str: str, end_str: str) -> Tuple[datetime, datetime]:
+    """compute_bounds for a calendar day; datetimes are immutable, so cached results are shared safely."""
+    now_utc = datetime(today.year, today.month, today.day, tzinfo=DEFAULT_TZ)
     month_start, month_end = month_bounds(now_utc)
     start = parse_config_date(start_str) or month_start
     if end_str:
@@ -163,9 +219,18 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--timeout", type=int, default=120, help="Timeout por requisição (s) (default=120)")
     p.add_argument("--insecure", action="store_true", help="DESATIVA verificação SSL (NÃO RECOMENDADO)")
     p.add_argument("--sow-field-id", default="", help="Override Jira SoW custom field id (e.g., customfield_12345)")
+    p.add_argument("--xlsx-compresslevel", type=int, choices=range(0, 10), default=1, metavar="0-9",
+                   help="Nível de compressão zip dos .xlsx (1 = mais rápido, 9 = menor arquivo) (default=1)")
+    p.add_argument("--no-field-cache", action="store_true",
+                   help="Não usa o cache local da lista de campos do Jira (/field)")
+    p.add_argument("--async", dest="use_async", action="store_true",
+                   help="Busca worklogs com asyncio + httpx (HTTP/2 se 'h2' instalado) em vez de threads")
+    p.add_argument("--bulk-worklogs", action="store_true",
+                   help="Busca worklogs pelos endpoints em lote (worklog/updated + worklog/list) em vez de um GET por issue; "
+                        "não vê worklogs lançados antes do início do intervalo (ver README)")
     return p.parse_args()
 
-def vprint(verbose: bool, *args, **kwargs):
+def vprint(verbose: bool, *args: Any, **kwargs: Any) -> None:
     """Print arguments only when verbose is True."""
     if verbose:
         print(*args, **kwargs)
@@ -225,12 +290,44 @@ def read_config(path: str) -> Dict[str, Any]:
         "max_workers": max_workers_cfg,
     }
 
+def _ensure_win_trust() -> bool:
+    """Apply the certifi-win32 Windows cert store patch once, if installed.
+
+    Only the first call pays for the sys.path scan and the patch; later calls
+    return the memoized result.
+
+    Returns:
+        bool: True if the Windows trust store is in use.
+    """
+    global _WIN_TRUST, _WIN_TRUST_CHECKED
+    if _WIN_TRUST_CHECKED:
+        return _WIN_TRUST
+    _WIN_TRUST_CHECKED = True
+    if os.name == "nt":
+        try:
+            import importlib
+            import importlib.util
+            if importlib.util.find_spec("certifi_win32") is not None:
+                importlib.import_module("certifi_win32")  # applies Windows cert store patch
+                _WIN_TRUST = True
+        except Exception:
+            _WIN_TRUST = False
+    return _WIN_TRUST
+
+POOL_MAXSIZE_FLOOR = 20  # kept-alive connections per host, at least; urllib3 opens them lazily
+CONNECT_RETRIES = 3  # urllib3-level retries for failed connects; status retries stay in _send_with_retry
+
 def make_session(email: str, token: str, verify: Optional[bool]=True, ca_bundle: Optional[str]="",
-                 http_proxy: str="", https_proxy: str="") -> requests.Session:
+                 http_proxy: str="", https_proxy: str="", max_workers: int=10) -> requests.Session:
     """Create a configured requests.Session for Jira API access.
 
     Applies basic auth with email/token, JSON headers, optional proxies,
-    and SSL verification or custom CA bundle.
+    and SSL verification or custom CA bundle. Mounts an HTTPAdapter whose
+    connection pool is sized to max_workers (2x, at least POOL_MAXSIZE_FLOOR)
+    so concurrent requests to the Jira host reuse kept-alive TCP/TLS
+    connections. The adapter retries only
+    connection failures (the request never reached Jira, so any method is
+    safe to resend); HTTP status retries are handled by _send_with_retry.
 
     Args:
         email: Jira account email (username).
@@ -239,11 +336,19 @@ def make_session(email: str, token: str, verify: Optional[bool]=True, ca_bundle:
         ca_bundle: Path to CA bundle to use for SSL verification.
         http_proxy: HTTP proxy URL.
         https_proxy: HTTPS proxy URL.
+        max_workers: Number of threads expected to share the session.
 
     Returns:
         requests.Session: Configured session instance.
     """
     s = requests.Session()
+    workers = max(1, int(max_workers))
+    retry = Retry(total=CONNECT_RETRIES, connect=CONNECT_RETRIES, read=0, redirect=0, status=0, other=0,
+                  allowed_methods=None, backoff_factor=0.5, raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=max(workers * 2, POOL_MAXSIZE_FLOOR),
+                          max_retries=retry)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
     s.auth = (email, token)
     s.headers.update({"Accept": "application/json", "Content-Type": "application/json"})
     if http_proxy or https_proxy:
@@ -256,28 +361,106 @@ def make_session(email: str, token: str, verify: Optional[bool]=True, ca_bundle:
     if ca_bundle:
         s.verify = ca_bundle
     else:
+        if verify:
+            _ensure_win_trust()
         s.verify = verify
     return s
 
-def ensure_field_exists(session: requests.Session, base_url: str, field_id: str, timeout: int, verbose=False) -> bool:
+def _response_json(r: requests.Response) -> Any:
+    """Decode a JSON response body straight from its raw bytes.
+
+    Skips Response.json()'s charset guess and intermediate str copy: orjson
+    (or msgspec) parses the bytes when installed, else json.loads (which detects UTF-8/16/32
+    itself, as RFC 8259 requires). Objects without raw bytes use r.json().
+    """
+    content = getattr(r, "content", None)
+    if isinstance(content, bytes):
+        if _fast_loads is not None:
+            return _fast_loads(content)
+        return json.loads(content)
+    return r.json()
+
+FIELD_CACHE_TTL = 24 * 3600  # seconds a cached /field listing is trusted without revalidation
+
+def default_field_cache_path() -> str:
+    """Return the per-user cache file for Jira field ids.
+
+    Uses %LOCALAPPDATA% on Windows and $XDG_CACHE_HOME (or ~/.cache) elsewhere.
+    """
+    if os.name == "nt" and os.environ.get("LOCALAPPDATA"):
+        root = os.environ["LOCALAPPDATA"]
+    else:
+        root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(root, "jira_worklog_extractor", "fields.json")
+
+def _load_field_cache(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def _save_field_cache(path: str, cache: Dict[str, Any]) -> None:
+    # Best effort: a read-only home or full disk must not break the export.
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(cache, fh)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+# (base_url, field_id) -> whether the field exists, for repeated main() calls in one process.
+# Only definitive answers are stored; failed /field requests are retried next time.
+_FIELD_EXISTS: Dict[Tuple[str, str], bool] = {}
+_FIELD_EXISTS_LOCK = threading.Lock()
+
+def ensure_field_exists(session: requests.Session, base_url: str, field_id: str, timeout: int, verbose: bool = False,
+                        cache_path: str = "") -> bool:
     """Check whether a custom field exists in Jira.
 
     Performs a GET to /rest/api/3/field and searches for field_id.
     On HTTP errors, logs a warning and returns True to avoid hard-failing.
 
+    Definitive answers are memoized in-process per (base_url, field_id).
+    When cache_path is given, the field ids are also cached there per base_url.
+    A listing younger than FIELD_CACHE_TTL that contains field_id answers
+    without any request; otherwise the GET is revalidated with If-None-Match
+    and a 304 reuses the cached ids.
+
     Args:
         session: Configured requests session.
         base_url: Jira base URL.
         field_id: Target field id (e.g., customfield_xxxxx).
         timeout: Request timeout in seconds.
         verbose: Whether to print verbose logs.
+        cache_path: Optional JSON cache file; empty disables caching.
 
     Returns:
         bool: True if the field exists or if validation is skipped; False if missing.
     """
+    known = _FIELD_EXISTS.get((base_url, field_id))
+    if known is not None:
+        if not known:
+            print(f"AVISO: Campo SoW '{field_id}' não encontrado. A coluna SoW ficará vazia.", file=sys.stderr)
+        return known
+
+    cache = _load_field_cache(cache_path) if cache_path else {}
+    entry = cache.get(base_url)
+    if not isinstance(entry, dict) or not isinstance(entry.get("ids"), list):
+        entry = None
+    if entry and time.time() - entry.get("ts", 0) < FIELD_CACHE_TTL and field_id in entry["ids"]:
+        vprint(verbose, f"Campo SoW '{field_id}' detectado (cache).")
+        return True
+
     url = f"{base_url}/rest/api/3/field"
     try:
-        r = session.get(url, timeout=timeout)
+        if entry and entry.get("etag"):
+            r = session.get(url, headers={"If-None-Match": entry["etag"]}, timeout=timeout)
+        else:
+            r = session.get(url, timeout=timeout)
         r.raise_for_status()
     except requests.exceptions.SSLError as e:
         print("ERRO SSL ao acessar /field:", e, file=sys.stderr)
@@ -289,7 +472,19 @@ def ensure_field_exists(session: requests.Session, base_url: str, field_id: str,
         print(f"AVISO: Falha não prevista ao listar campos: {e}. Continuando...", file=sys.stderr)
         return True
 
-    exists = any(f.get("id") == field_id for f in r.json())
+    if r.status_code == 304 and entry:
+        ids = set(entry["ids"])
+        etag = entry.get("etag")
+    else:
+        ids = {f.get("id") for f in _response_json(r)}
+        etag = r.headers.get("ETag")
+    if cache_path:
+        cache[base_url] = {"ts": time.time(), "etag": etag, "ids": sorted(i for i in ids if isinstance(i, str))}
+        _save_field_cache(cache_path, cache)
+
+    exists = field_id in ids
+    with _FIELD_EXISTS_LOCK:
+        _FIELD_EXISTS[(base_url, field_id)] = exists
     if not exists:
         print(f"AVISO: Campo SoW '{field_id}' não encontrado. A coluna SoW ficará vazia.", file=sys.stderr)
     else:
@@ -302,12 +497,61 @@ def jql_for_range(start_utc: datetime, end_utc: datetime) -> str:
     date_to   = (end_utc - timedelta(days=1)).date().isoformat()
     return f'worklogDate >= "{date_from}" AND worklogDate <= "{date_to}"'
 
+RETRY_BACKOFF_CAP = 30.0  # upper bound (s) for a single jittered retry wait
+
+def _retry_delay(r: requests.Response, prev: float, backoff_base: float) -> float:
+    """Seconds to wait before retrying after response r.
+
+    A numeric Retry-After wins (0 means retry right away). Otherwise uses
+    decorrelated jitter, min(cap, uniform(base, prev * 3)): concurrent
+    workers spread out instead of retrying in lockstep, which keeps the
+    total retry volume down under a shared rate limit.
+    """
+    retry_after = r.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    return min(RETRY_BACKOFF_CAP, random.uniform(backoff_base, max(backoff_base, prev * 3)))
+
+def _send_with_retry(send: Callable[[], requests.Response], max_tries: int, backoff_base: float,
+                     cancel_event: Optional[threading.Event] = None) -> requests.Response:
+    """Call send() until it succeeds or max_tries is reached; return the last response.
+
+    429/5xx are retried by status code; any other response is retried only if
+    raise_for_status() raises HTTPError. No wait follows the final attempt.
+    With cancel_event, waits end as soon as it is set and the last response
+    is returned without further attempts.
+    """
+    tries = 0
+    prev = backoff_base
+    while True:
+        tries += 1
+        r = send()
+        if not (r.status_code == 429 or 500 <= r.status_code < 600):
+            try:
+                r.raise_for_status()
+                return r
+            except requests.HTTPError:
+                pass
+        if tries >= max_tries:
+            return r
+        delay = _retry_delay(r, prev, backoff_base)
+        if cancel_event is not None:
+            if cancel_event.wait(delay):
+                return r
+        elif delay > 0:
+            time.sleep(delay)
+        prev = max(delay, backoff_base)
+
 def http_get_with_retry(session: requests.Session, url: str, params: Optional[Dict[str, Any]]=None,
-                        timeout: int=120, max_tries: int=5, backoff_base: float=0.5) -> Optional[requests.Response]:
+                        timeout: int=120, max_tries: int=5, backoff_base: float=0.5,
+                        cancel_event: Optional[threading.Event]=None) -> Optional[requests.Response]:
     """HTTP GET with retry/backoff on 429 and 5xx responses.
 
-    Honors Retry-After header when present; returns the final response even if
-    it is an error after exhausting retries.
+    Waits use decorrelated jitter (see _retry_delay) and honor Retry-After;
+    returns the final response even if it is an error after exhausting retries.
 
     Args:
         session: requests.Session to use.
@@ -315,68 +559,25 @@ def http_get_with_retry(session: requests.Session, url: str, params: Optional[Di
         params: Optional query parameters.
         timeout: Per-request timeout seconds.
         max_tries: Maximum number of attempts.
-        backoff_base: Base seconds for exponential backoff.
+        backoff_base: Minimum seconds between attempts (jitter floor).
+        cancel_event: Optional event that cuts retry waits short once set.
 
     Returns:
         Optional[requests.Response]: Response object or None if a request failed before yielding a response.
     """
-    tries = 0
-    while True:
-        tries += 1
-        try:
-            r = session.get(url, params=params, timeout=timeout)
-        except requests.exceptions.SSLError:
-            raise
-        if r.status_code == 429 or 500 <= r.status_code < 600:
-            retry_after = r.headers.get("Retry-After")
-            if retry_after:
-                try:
-                    wait = float(retry_after)
-                except Exception:
-                    wait = backoff_base * (2 ** (tries - 1))
-            else:
-                wait = backoff_base * (2 ** (tries - 1))
-            if tries < max_tries:
-                time.sleep(wait)
-                continue
-        try:
-            r.raise_for_status()
-            return r
-        except requests.HTTPError:
-            if tries < max_tries:
-                time.sleep(backoff_base * (2 ** (tries - 1)))
-                continue
-            return r
+    # SSLError propagates to the caller untouched (no retry).
+    return _send_with_retry(lambda: session.get(url, params=params, timeout=timeout), max_tries, backoff_base,
+                            cancel_event)
 
 def http_post_with_retry(session: requests.Session, url: str, json: Dict[str, Any],
                          timeout: int = 120, max_tries: int = 5, backoff_base: float = 0.5) -> requests.Response:
-    """HTTP POST with retry/backoff on 429 and 5xx responses. Returns the final response."""
-    tries = 0
-    while True:
-        tries += 1
-        r = session.post(url, json=json, timeout=timeout)
-        if r.status_code == 429 or 500 <= r.status_code < 600:
-            retry_after = r.headers.get("Retry-After")
-            if retry_after:
-                try:
-                    wait = float(retry_after)
-                except Exception:
-                    wait = backoff_base * (2 ** (tries - 1))
-            else:
-                wait = backoff_base * (2 ** (tries - 1))
-            if tries < max_tries:
-                time.sleep(wait)
-                continue
-        try:
-            r.raise_for_status()
-            return r
-        except requests.HTTPError:
-            if tries < max_tries:
-                time.sleep(backoff_base * (2 ** (tries - 1)))
-                continue
-            return r
+    """HTTP POST with jittered retry on 429, 5xx and other HTTP errors. Returns the final response."""
+    return _send_with_retry(lambda: session.post(url, json=json, timeout=timeout), max_tries, backoff_base)
+
+PAGE_SIZE = 1000  # maxResults asked of paginated endpoints; Jira may cap pages lower
 
-def post_search_jql(session: requests.Session, base_url: str, jql: str, fields: List[str], timeout: int, verbose=False) -> List[Dict[str, Any]]:
+def post_search_jql(session: requests.Session, base_url: str, jql: str, fields: List[str],
+                    timeout: int, verbose: bool = False) -> List[Dict[str, Any]]:
     """Query Jira using POST /search/jql and paginate using nextPageToken.
 
     Args:
@@ -394,7 +595,7 @@ def post_search_jql(session: requests.Session, base_url: str, jql: str, fields:
     next_token: Optional[str] = None
     issues_all: List[Dict[str, Any]] = []
     while True:
-        body = {"jql": jql, "fields": fields, "maxResults": 100}
+        body = {"jql": jql, "fields": fields, "maxResults": PAGE_SIZE}
         if next_token:
             body["nextPageToken"] = next_token
         r = http_post_with_retry(session, url, json=body, timeout=timeout, backoff_base=0.0)
@@ -403,29 +604,93 @@ def post_search_jql(session: requests.Session, base_url: str, jql: str, fields:
         except requests.HTTPError:
             print(f"ERRO: search/jql falhou ({getattr(r,'status_code','N/A')}). Resposta do servidor:\n{getattr(r,'text','')}", file=sys.stderr)
             sys.exit(3)
-        data = r.json()
+        data = _response_json(r)
         issues = data.get("issues", [])
-        issues_all.extend(issues)
         next_token = data.get("nextPageToken")
+        if verbose and not issues_all and next_token and len(issues) < PAGE_SIZE:
+            print(f"AVISO: servidor limitou a página de search/jql a {len(issues)} issues (pedido: {PAGE_SIZE}).", file=sys.stderr)
+        issues_all.extend(issues)
         if not next_token or not issues:
             break
     return issues_all
 
+def split_date_range(start_utc: datetime, end_utc: datetime, parts: int) -> List[Tuple[datetime, datetime]]:
+    """Split [start_utc, end_utc) into at most `parts` contiguous whole-day windows."""
+    days = max(1, (end_utc - start_utc).days)
+    step = timedelta(days=-(-days // max(1, parts)))
+    windows: List[Tuple[datetime, datetime]] = []
+    cur = start_utc
+    while cur < end_utc:
+        nxt = min(cur + step, end_utc)
+        windows.append((cur, nxt))
+        cur = nxt
+    return windows
+
+def post_search_jql_parallel(session: requests.Session, base_url: str, start_utc: datetime, end_utc: datetime,
+                             fields: List[str], timeout: int, max_workers: int = 8, verbose: bool = False) -> List[Dict[str, Any]]:
+    """Search issues with worklogs in [start_utc, end_utc), one JQL per date window in parallel.
+
+    /search/jql only paginates through nextPageToken, so a single query is
+    strictly serial. The range is split into up to max_workers day windows,
+    each searched concurrently, and results are merged in window order with
+    duplicates (issues with worklogs in several windows) dropped by key.
+    Falls back to a single serial search for one-day ranges or one worker.
+
+    Returns:
+        List[Dict[str, Any]]: Deduplicated list of issue objects.
+    """
+    windows = split_date_range(start_utc, end_utc, max_workers)
+    if len(windows) <= 1 or max_workers <= 1:
+        return post_search_jql(session, base_url, jql_for_range(start_utc, end_utc), fields, timeout=timeout, verbose=verbose)
+
+    def search_window(window: Tuple[datetime, datetime]) -> List[Dict[str, Any]]:
+        """Run the paginated search for a single date window."""
+        return post_search_jql(session, base_url, jql_for_range(*window), fields, timeout=timeout, verbose=verbose)
+
+    with ThreadPoolExecutor(max_workers=len(windows)) as executor:
+        batches = list(executor.map(search_window, windows))
+
+    seen = set()
+    issues_all: List[Dict[str, Any]] = []
+    for batch in batches:
+        for issue in batch:
+            key = issue.get("key")
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            issues_all.append(issue)
+    return issues_all
+
 def adf_to_text(adf: Any) -> str:
     """Convert Atlassian Document Format (ADF) content to plain text."""
     if isinstance(adf, str):
         return adf
     if not isinstance(adf, dict):
         return ""
-    result_lines: List[str] = []
+    return _adf_walk(adf)
 
-    def walk(node: Any):
-        """Depth-first traversal of ADF nodes; collects plain text into result_lines."""
-        t = node.get("type") if isinstance(node, dict) else None
-        if t == "doc":
-            for c in node.get("content", []):
-                walk(c)
-        elif t in ("paragraph", "heading", "blockquote"):
+def _adf_walk(adf: Dict[str, Any]) -> str:
+    """Walk an ADF document tree and return its plain-text rendering.
+
+    Depth-first over an explicit stack rather than recursion; a listItem
+    pushes a ("li", start) marker below its children so the lines they
+    produced get their "- " prefix once the item is done.
+    """
+    result_lines: List[str] = []
+    stack: List[Any] = [adf]
+    pop, push = stack.pop, stack.extend
+    while stack:
+        node = pop()
+        if type(node) is tuple:
+            for i in range(node[1], len(result_lines)):
+                if result_lines[i].strip():
+                    result_lines[i] = "- " + result_lines[i]
+            continue
+        if not isinstance(node, dict):
+            continue
+        t = node.get("type")
+        if t in ("paragraph", "heading", "blockquote"):
             segs: List[str] = []
             for c in node.get("content", []):
                 if c.get("type") == "text":
@@ -437,28 +702,20 @@ def adf_to_text(adf: Any) -> str:
                     if isinstance(txt, str):
                         segs.append(txt)
             result_lines.append("".join(segs))
-        elif t in ("bulletList", "orderedList"):
-            for li in node.get("content", []):
-                walk(li)
-        elif t == "listItem":
-            before = len(result_lines)
-            for c in node.get("content", []):
-                walk(c)
-            for i in range(before, len(result_lines)):
-                if result_lines[i].strip():
-                    result_lines[i] = "- " + result_lines[i]
-        else:
-            if isinstance(node, dict):
-                for c in node.get("content", []):
-                    walk(c)
+            continue
+        if t == "listItem":
+            stack.append(("li", len(result_lines)))
+        push(reversed(node.get("content", [])))
 
-    walk(adf)
     text = "\n".join([line.rstrip() for line in result_lines]).strip()
     return text
 
+# Keys tried, in order, for a human-friendly label of a field-like dict.
+_LABEL_KEYS = ("value", "name", "label", "title", "key")
+
 def _best_label(d: Dict[str, Any]) -> str:
     """Return the best human-friendly label from a field-like dict."""
-    for k in ("value", "name", "label", "title", "key"):
+    for k in _LABEL_KEYS:
         v = d.get(k)
         if isinstance(v, str) and v.strip():
             return v.strip()
@@ -482,112 +739,191 @@ def _flatten_hierarchy(d: Dict[str, Any]) -> List[str]:
     return labels
 
 def stringify_sow(val: Any) -> str:
-    """Convert various SoW field shapes (str, dict tree, list) into a string."""
+    """Convert various SoW field shapes (str, dict tree, list) into a string.
+
+    Lists (nested ones included) are flattened iteratively; non-empty entries
+    are joined with " | ".
+    """
     if val is None:
         return ""
     if isinstance(val, str):
         return val
-    if isinstance(val, list):
-        parts = [stringify_sow(x) for x in val]
-        parts = [p for p in parts if p]
-        return " | ".join(parts)
     if isinstance(val, dict):
-        labels = _flatten_hierarchy(val)
-        return ":".join(labels)
-    return str(val)
+        return ":".join(_flatten_hierarchy(val))
+    if not isinstance(val, list):
+        return str(val)
+    parts: List[str] = []
+    stack: List[Any] = [val]
+    while stack:
+        x = stack.pop()
+        if isinstance(x, list):
+            stack.extend(reversed(x))
+        elif isinstance(x, str):
+            if x:
+                parts.append(x)
+        elif isinstance(x, dict):
+            lab = ":".join(_flatten_hierarchy(x))
+            if lab:
+                parts.append(lab)
+        elif x is not None:
+            parts.append(str(x))
+    return " | ".join(parts)
 
 def numeric_only(s: str) -> str:
     """Extract the first numeric substring from s; return '' if none found."""
     if not s:
         return ""
-    m = re.search(r"\d+", s)
+    if s.isdecimal():
+        return s
+    m = _NUM_RE.search(s)
     return m.group(0) if m else ""
 
-def fetch_worklogs_for_issue(base_url: str, session_factory, issue: Dict[str, Any],
-                             start_utc: datetime, end_utc: datetime, timeout: int) -> List[Dict[str, Any]]:
+@functools.lru_cache(maxsize=4096)
+def _sow_numeric(sow_str: str) -> str:
+    """Reduce a stringified SoW to its numeric part(s), keeping ' | ' between list entries.
+
+    Memoized: SoW values repeat heavily across issues of the same contract.
+    """
+    if " | " in sow_str:
+        parts = [numeric_only(p) for p in sow_str.split(" | ")]
+        return " | ".join(p for p in parts if p)
+    return numeric_only(sow_str)
+
+@functools.lru_cache(maxsize=1024)
+def _sow_from_json(key: str) -> str:
+    return _sow_numeric(stringify_sow(json.loads(key)))
+
+def _sow_value(raw: Any) -> str:
+    """Compute the report SoW value (numeric part) straight from the raw field value.
+
+    Plain strings and single-level option dicts (the usual select-field shape)
+    take a direct path. Other structured values (cascading trees, lists) are
+    memoized by their compact JSON, so each distinct SoW is walked once per run
+    even though every issue carries its own decoded copy.
+    """
+    if raw is None:
+        return ""
+    if isinstance(raw, str):
+        return _sow_numeric(raw)
+    if isinstance(raw, dict) and not raw.get("child") and not isinstance(raw.get("children"), list):
+        return _sow_numeric(_best_label(raw))
+    if isinstance(raw, (dict, list)):
+        try:
+            key = json.dumps(raw, sort_keys=True, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return _sow_numeric(stringify_sow(raw))
+        return _sow_from_json(key)
+    return _sow_numeric(stringify_sow(raw))
+
+def _comment_text(comment: Any) -> str:
+    """Render a worklog comment, either an ADF document or a plain value, as text."""
+    if isinstance(comment, dict):
+        return adf_to_text(comment)
+    return str(comment) if comment else ""
+
+@functools.lru_cache(maxsize=2048)
+def _parse_started(raw: str) -> Optional[datetime]:
+    """Parse a Jira worklog 'started' timestamp (e.g. 2025-10-10T10:00:00.000+0000).
+
+    Jira emits the offset without a colon, which datetime.fromisoformat only
+    accepts from Python 3.11; older parsers get it normalized to +HH:MM first.
+    Returns None when the value cannot be parsed. Memoized on the raw string.
+    """
+    if not _ISO_COMPACT_OFFSET_OK and len(raw) > 5 and raw[-5] in "+-" and raw[-4:].isdigit():
+        raw = f"{raw[:-2]}:{raw[-2:]}"
+    try:
+        return _parse_iso(raw)
+    except ValueError:
+        return None
+
+def _issue_base(issue: Dict[str, Any]) -> Row:
+    """Return the issue-level leading columns of a report row (Projeto .. SoW)."""
+    f = issue.get("fields", {})
+    projeto    = (f.get("project") or {}).get("name", "")
+    tipo       = (f.get("issuetype") or {}).get("name", "")
+    prioridade = (f.get("priority") or {}).get("name", "")
+    resumo     = f.get("summary", "")
+    sow_value  = _sow_value(f.get(SOW_FIELD_ID, None))
+    return (projeto, tipo, issue.get("key"), resumo, prioridade, sow_value)
+
+def _append_worklog_rows(linhas: List[Row], base: Row, wlogs: List[Dict[str, Any]],
+                         start_utc: datetime, end_utc: datetime) -> None:
+    """Map a batch of worklogs of one issue to report rows, keeping those within [start_utc, end_utc)."""
+    if not wlogs:
+        return
+    # Jira Cloud returns ADF comments, Server plain strings: decide once per batch.
+    # adf_to_text also passes strings through, so a mixed batch stays correct.
+    desc_fn = adf_to_text if isinstance(wlogs[0].get("comment"), dict) else _comment_text
+
+    # Hot loop: bind globals/methods to locals once per batch.
+    parse = _parse_started
+    s_ts = start_utc.timestamp()
+    e_ts = end_utc.timestamp()
+    # Offsets are within ±14h, so an in-range worklog's local date lies within a day
+    # of the window: a cheap string check drops older/newer history before parsing.
+    lo_day = (start_utc - timedelta(days=1)).date().isoformat()
+    hi_day = (end_utc + timedelta(days=1)).date().isoformat()
+    append = linhas.append
+    _round = round
+    _str = str
+    for wl in wlogs:
+        get = wl.get
+        started_raw = get("started", "")
+        if not isinstance(started_raw, _str):
+            continue
+        # Local calendar day, as written by Jira: reused for the row instead of formatting dt.
+        day = started_raw[:10]
+        if len(day) != 10 or not (lo_day <= day <= hi_day):
+            continue
+        dt = parse(started_raw)
+        # Epoch seconds are offset-independent: same window as comparing in DEFAULT_TZ.
+        if not dt or not (s_ts <= dt.timestamp() < e_ts):
+            continue
+
+        display_name = (get("author") or {}).get("displayName", "")
+        horas = _round((get("timeSpentSeconds", 0) or 0) / 3600.0, 2)
+
+        # Issue-level prefix (built once per issue by _issue_base) + per-worklog fields.
+        append(base + (day, display_name, horas, desc_fn(get("comment", ""))))
+
+def fetch_worklogs_for_issue(base_url: str, session: requests.Session, issue: Dict[str, Any],
+                             start_utc: datetime, end_utc: datetime, timeout: int,
+                             cancel_event: Optional[threading.Event]=None) -> List[Row]:
     """Fetch worklogs for a single issue and map to report rows within a date range.
 
     Args:
         base_url: Jira base URL.
-        session_factory: Callable that returns a configured requests.Session.
+        session: Configured requests.Session, shared across worker threads.
         issue: Issue JSON object from search results.
         start_utc: Inclusive lower bound (DEFAULT_TZ).
         end_utc: Exclusive upper bound (DEFAULT_TZ).
         timeout: Per-request timeout seconds.
+        cancel_event: Optional event; once set, retry waits end and no further pages are requested.
 
     Returns:
-        List[Dict[str, Any]]: Row dicts ready for DataFrame construction.
+        List[Row]: Row tuples in COLS order, ready to append to a worksheet.
     """
-    key = issue.get("key")
-    f = issue.get("fields", {})
+    base = _issue_base(issue)
+    key = base[2]
 
-    projeto    = (f.get("project") or {}).get("name", "")
-    tipo       = (f.get("issuetype") or {}).get("name", "")
-    prioridade = (f.get("priority") or {}).get("name", "")
-    resumo     = f.get("summary", "")
-
-    sow_raw = f.get(SOW_FIELD_ID, None)
-    sow_str = stringify_sow(sow_raw)
-    if " | " in sow_str:
-        parts = [numeric_only(p) for p in sow_str.split(" | ")]
-        parts = [p for p in parts if p]
-        sow_value = " | ".join(parts)
-    else:
-        sow_value = numeric_only(sow_str)
-
-    sess = session_factory()
-
-    linhas: List[Dict[str, Any]] = []
+    linhas: List[Row] = []
     start_at = 0
-    max_results = 100
 
     while True:
         url_wl = f"{base_url}/rest/api/3/issue/{key}/worklog"
-        params = {"startAt": start_at, "maxResults": max_results}
-        rw = http_get_with_retry(sess, url_wl, params=params, timeout=timeout)
+        params = {"startAt": start_at, "maxResults": PAGE_SIZE}
+        rw = http_get_with_retry(session, url_wl, params=params, timeout=timeout, cancel_event=cancel_event)
+        if cancel_event is not None and cancel_event.is_set():
+            break
         if rw is None or rw.status_code >= 400:
             sys.stderr.write(f"AVISO: worklog de {key} retornou status {getattr(rw,'status_code', 'N/A')}.\n")
             break
-        wdata = rw.json()
+        wdata = _response_json(rw)
         wlogs = wdata.get("worklogs", [])
         if not wlogs:
             break
 
-        for wl in wlogs:
-            started_raw = wl.get("started", "")
-            try:
-                if isinstance(started_raw, str) and started_raw.endswith("+0000"):
-                    started_raw = started_raw[:-5] + "+00:00"
-                dt = datetime.fromisoformat(started_raw)
-            except Exception:
-                dt = None
-            if not dt or not (start_utc <= dt.astimezone(DEFAULT_TZ) < end_utc):
-                continue
-
-            display_name = (wl.get("author") or {}).get("displayName", "")
-            seconds = wl.get("timeSpentSeconds", 0) or 0
-            horas = round(seconds / 3600.0, 2)
-
-            comment = wl.get("comment", "")
-            if isinstance(comment, dict):
-                desc = adf_to_text(comment)
-            else:
-                desc = str(comment) if comment else ""
-
-            data_inicio = dt.date().isoformat()
-
-            linhas.append({
-                "Projeto": projeto,
-                "Tipo de Problema": tipo,
-                "Clave": key,
-                "Resumo": resumo,
-                "Prioridade": prioridade,
-                "SoW": sow_value,
-                "Data de Início": data_inicio,
-                "Nome de Exibição": display_name,
-                "Tempo Gasto (h)": horas,
-                "Descrição do Trabalho": desc,
-            })
+        _append_worklog_rows(linhas, base, wlogs, start_utc, end_utc)
 
         start_at += len(wlogs)
         if start_at >= wdata.get("total", 0):
@@ -595,7 +931,351 @@ def fetch_worklogs_for_issue(base_url: str, session_factory, issue: Dict[str, An
 
     return linhas
 
-def main():
+def fetch_worklogs_bulk(base_url: str, session: requests.Session, issues: List[Dict[str, Any]],
+                        start_utc: datetime, end_utc: datetime, timeout: int,
+                        verbose: bool = False) -> Tuple[List[Row], List[Dict[str, Any]]]:
+    """Fetch worklogs for many issues through Jira's bulk worklog endpoints.
+
+    Lists the ids of every worklog updated since start_utc via
+    GET /rest/api/3/worklog/updated (following nextPage to the last page),
+    then hydrates them in batches of up to 1000 via POST
+    /rest/api/3/worklog/list and joins each worklog to its issue by
+    issueId. The feed is not cut at end_utc: worklogs logged late or edited
+    after the range still come back, and _append_worklog_rows keeps only
+    those whose 'started' falls in the range. This replaces one or more
+    requests per issue with a handful of bulk calls.
+
+    The only worklogs the feed cannot list are ones last updated before
+    start_utc yet started inside the range (logged ahead of time). Issues
+    that end up without any in-range row are returned separately so the caller can fetch them with
+    fetch_worklogs_for_issue; issues with other in-range rows are not
+    re-fetched. If any bulk call fails, every issue is returned for the
+    per-issue path.
+
+    Returns:
+        Tuple[List[Row], List[Dict[str, Any]]]: (rows, issues still to fetch per issue).
+    """
+    by_id = {str(i.get("id")): i for i in issues if i.get("id") is not None}
+    if not by_id:
+        return [], list(issues)
+
+    ids: List[int] = []
+    url: Optional[str] = f"{base_url}/rest/api/3/worklog/updated"
+    params: Optional[Dict[str, Any]] = {"since": int(start_utc.timestamp() * 1000)}
+    while url:
+        r = http_get_with_retry(session, url, params=params, timeout=timeout)
+        if r is None or r.status_code >= 400:
+            sys.stderr.write(f"AVISO: worklog/updated retornou status {getattr(r,'status_code', 'N/A')}; usando busca por issue.\n")
+            return [], list(issues)
+        data = _response_json(r)
+        ids.extend(v["worklogId"] for v in data.get("values", []) if "worklogId" in v)
+        url = None if data.get("lastPage", True) else data.get("nextPage")
+        params = None
+    vprint(verbose, f"Worklogs atualizados desde o início do intervalo: {len(ids)}")
+
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    url_list = f"{base_url}/rest/api/3/worklog/list"
+    for i in range(0, len(ids), 1000):
+        r = http_post_with_retry(session, url_list, json={"ids": ids[i:i + 1000]}, timeout=timeout)
+        if r.status_code >= 400:
+            # A lost batch may hold worklogs of issues that other batches matched: refetch all per issue
+            sys.stderr.write(f"AVISO: worklog/list retornou status {r.status_code}; usando busca por issue.\n")
+            return [], list(issues)
+        for wl in _response_json(r):
+            issue_id = str(wl.get("issueId"))
+            if issue_id in by_id:
+                grouped.setdefault(issue_id, []).append(wl)
+
+    linhas: List[Row] = []
+    pending: List[Dict[str, Any]] = []
+    for issue in issues:
+        before = len(linhas)
+        wlogs = grouped.get(str(issue.get("id")))
+        if wlogs:
+            _append_worklog_rows(linhas, _issue_base(issue), wlogs, start_utc, end_utc)
+        if len(linhas) == before:
+            pending.append(issue)
+    return linhas, pending
+
+def make_async_client(email: str, token: str, verify: Optional[bool]=True, ca_bundle: str="",
+                      http_proxy: str="", https_proxy: str="", max_workers: int=10) -> "httpx.AsyncClient":
+    """Create an httpx.AsyncClient configured like make_session.
+
+    Used by the --async worklog fan-out. HTTP/2 is negotiated when the
+    optional ``h2`` package is installed, so many requests share a few
+    connections. Requires ``httpx`` (pip install .[async]).
+
+    Args:
+        email: Jira account email for basic auth.
+        token: Jira API token for basic auth.
+        verify: Whether to verify TLS certificates.
+        ca_bundle: Optional path to CA bundle to use for TLS verification.
+        http_proxy: Optional HTTP proxy URL.
+        https_proxy: Optional HTTPS proxy URL (preferred when both are set).
+        max_workers: Base concurrency; the pool allows 4x as many connections.
+
+    Returns:
+        httpx.AsyncClient: Configured client (use as an async context manager).
+
+    Raises:
+        ImportError: If httpx is not installed.
+    """
+    import importlib.util
+
+    import httpx
+
+    if ca_bundle:
+        tls_verify: Any = ssl.create_default_context(cafile=ca_bundle)
+    else:
+        if verify:
+            _ensure_win_trust()
+        tls_verify = verify
+    conns = max(1, int(max_workers)) * 4
+    kwargs: Dict[str, Any] = {}
+    if https_proxy or http_proxy:
+        kwargs["proxy"] = https_proxy or http_proxy
+    return httpx.AsyncClient(
+        auth=(email, token),
+        headers={"Accept": "application/json", "Content-Type": "application/json"},
+        verify=tls_verify,
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=conns, max_keepalive_connections=conns),
+        **kwargs,
+    )
+
+async def _async_get_with_retry(client: "httpx.AsyncClient", url: str, params: Optional[Dict[str, Any]]=None,
+                                timeout: int=120, max_tries: int=5, backoff_base: float=0.5,
+                                sem: Optional[asyncio.Semaphore]=None) -> "httpx.Response":
+    """Async counterpart of http_get_with_retry: jittered retry on 429/5xx, honoring Retry-After.
+
+    When sem is given, each attempt holds one of its slots while the request
+    is in flight (not during the backoff sleep).
+
+    Returns the final response, which may still be an error status.
+    """
+    tries = 0
+    prev = backoff_base
+    while True:
+        tries += 1
+        if sem is None:
+            r = await client.get(url, params=params, timeout=timeout)
+        else:
+            async with sem:
+                r = await client.get(url, params=params, timeout=timeout)
+        if (r.status_code == 429 or 500 <= r.status_code < 600) and tries < max_tries:
+            delay = _retry_delay(r, prev, backoff_base)
+            await asyncio.sleep(delay)
+            prev = max(delay, backoff_base)
+            continue
+        return r
+
+async def _fetch_pages_async(client: "httpx.AsyncClient", url: str, offsets: Iterable[int], page_size: int,
+                             timeout: int, sem: Optional[asyncio.Semaphore]=None) -> List["httpx.Response"]:
+    """GET the worklog pages starting at each offset concurrently; responses come back in offset order."""
+    return await asyncio.gather(*(
+        _async_get_with_retry(client, url, params={"startAt": off, "maxResults": page_size}, timeout=timeout, sem=sem)
+        for off in offsets
+    ))
+
+async def fetch_worklogs_for_issue_async(client: "httpx.AsyncClient", base_url: str, issue: Dict[str, Any],
+                                         start_utc: datetime, end_utc: datetime, timeout: int,
+                                         sem: Optional[asyncio.Semaphore]=None) -> List[Row]:
+    """Async variant of fetch_worklogs_for_issue over an httpx.AsyncClient.
+
+    The first page reports the total; the remaining pages are then requested
+    together (sized like the first page, in case the server capped it) and
+    processed in order, so an issue with K pages costs about two round trips.
+    Every page request takes a slot of sem, when given.
+    """
+    base = _issue_base(issue)
+    key = base[2]
+
+    linhas: List[Row] = []
+    url_wl = f"{base_url}/rest/api/3/issue/{key}/worklog"
+    rw = await _async_get_with_retry(client, url_wl, params={"startAt": 0, "maxResults": PAGE_SIZE}, timeout=timeout, sem=sem)
+    pages = [rw]
+    if rw.status_code < 400:
+        wdata = _response_json(rw)
+        page_size = len(wdata.get("worklogs", []))
+        total = wdata.get("total", 0)
+        if page_size and total > page_size:
+            pages.extend(await _fetch_pages_async(client, url_wl, range(page_size, total, page_size), page_size, timeout, sem))
+
+    for rw in pages:
+        if rw.status_code >= 400:
+            sys.stderr.write(f"AVISO: worklog de {key} retornou status {rw.status_code}.\n")
+            break
+        wlogs = _response_json(rw).get("worklogs", [])
+        if not wlogs:
+            break
+        _append_worklog_rows(linhas, base, wlogs, start_utc, end_utc)
+
+    return linhas
+
+async def fetch_all_worklogs_async(client: "httpx.AsyncClient", base_url: str, issues: List[Dict[str, Any]],
+                                   start_utc: datetime, end_utc: datetime, timeout: int,
+                                   max_in_flight: int, progress: Optional[Any]=None) -> List[Row]:
+    """Fetch worklogs for all issues concurrently on one event loop.
+
+    At most max_in_flight page requests are in flight at a time, across all
+    issues. A failing issue is reported and skipped, like in the threaded path.
+
+    Args:
+        progress: Optional tqdm-like object, updated once per finished issue.
+    """
+    sem = asyncio.Semaphore(max(1, int(max_in_flight)))
+
+    async def one(issue: Dict[str, Any]) -> List[Row]:
+        try:
+            return await fetch_worklogs_for_issue_async(client, base_url, issue, start_utc, end_utc, timeout, sem)
+        finally:
+            if progress is not None:
+                progress.update(1)
+
+    results = await asyncio.gather(*(one(i) for i in issues), return_exceptions=True)
+    linhas: List[Row] = []
+    for res in results:
+        if isinstance(res, BaseException):
+            sys.stderr.write(f"AVISO: falha em uma issue: {res}\n")
+        else:
+            linhas.extend(res)
+    return linhas
+
+def fetch_worklogs_async(base_url: str, email: str, token: str, issues: List[Dict[str, Any]],
+                         start_utc: datetime, end_utc: datetime, timeout: int, max_workers: int,
+                         verify: Optional[bool]=True, ca_bundle: str="", http_proxy: str="", https_proxy: str="",
+                         progress: Optional[Any]=None) -> List[Row]:
+    """Run the asyncio worklog fan-out to completion (see fetch_all_worklogs_async).
+
+    Up to 4 * max_workers requests are in flight at once.
+
+    Raises:
+        ImportError: If httpx is not installed.
+    """
+    async def run() -> List[Row]:
+        async with make_async_client(email, token, verify=verify, ca_bundle=ca_bundle, http_proxy=http_proxy,
+                                     https_proxy=https_proxy, max_workers=max_workers) as client:
+            return await fetch_all_worklogs_async(client, base_url, issues, start_utc, end_utc, timeout,
+                                                  max_in_flight=max_workers * 4, progress=progress)
+    return asyncio.run(run())
+
+def _progress_bar(total: int) -> tqdm:
+    """Progress bar for the worklog phase.
+
+    Redraws are throttled (mininterval/miniters) and the bar is disabled
+    when stderr is not a TTY, so piped logs and CI don't pay for escape codes.
+    """
+    return tqdm(total=total, desc="Processando issues", unit="issue",
+                mininterval=0.5, miniters=max(1, total // 200), disable=None)
+
+def _write_xlsx_xlsxwriter(xlsxwriter: Any, path: str, columns: Sequence[str], rows_iter: Iterable[Sequence[Any]],
+                           sheet_name: str) -> None:
+    """Write rows with xlsxwriter in constant_memory mode (rows are flushed as written)."""
+    # No auto-hyperlinks: keep cell contents identical to the openpyxl writer.
+    wb = xlsxwriter.Workbook(path, {"constant_memory": True, "strings_to_urls": False})
+    try:
+        ws = wb.add_worksheet(sheet_name)
+        ws.write_row(0, 0, [str(c) for c in columns], wb.add_format({"bold": True}))
+        write_row = ws.write_row
+        for i, row in enumerate(rows_iter, 1):
+            write_row(i, 0, row)
+    finally:
+        wb.close()
+
+def write_xlsx_streaming(path: str, columns: Sequence[str], rows_iter: Iterable[Sequence[Any]],
+                         sheet_name: str = "Relatório", compresslevel: int = 1, prefer_xlsxwriter: bool = False) -> None:
+    """Write rows to an .xlsx file using an openpyxl write-only workbook.
+
+    Rows are streamed to disk as they are appended, so memory stays flat
+    regardless of how many worklogs are exported.
+
+    Args:
+        path: Destination .xlsx path.
+        columns: Header row values.
+        rows_iter: Iterable of row sequences, in the same order as columns.
+        sheet_name: Worksheet title.
+        compresslevel: zlib level for the xlsx archive (1 = fastest, 9 = smallest).
+            Level 1 saves much faster than openpyxl's default for little size cost.
+        prefer_xlsxwriter: Write with xlsxwriter when it is installed. It is faster
+            per row but uses its own deflate level, so compresslevel is ignored.
+    """
+    if prefer_xlsxwriter:
+        try:
+            import xlsxwriter
+        except ImportError:
+            pass
+        else:
+            _write_xlsx_xlsxwriter(xlsxwriter, path, columns, rows_iter, sheet_name)
+            return
+
+    # Imported here: openpyxl is the heaviest import and only needed once rows are ready,
+    # so --help and config errors return without loading it.
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    from openpyxl.writer.excel import ExcelWriter
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_name)
+    # Bold header like the former pandas export; one shared style for all header cells.
+    bold = Font(bold=True)
+    header = []
+    for c in columns:
+        cell = WriteOnlyCell(ws, value=str(c))
+        cell.font = bold
+        header.append(cell)
+    ws.append(header)
+    for row in rows_iter:
+        ws.append(row)
+    # Same as wb.save(path), but with our own deflate level on the archive.
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED, allowZip64=True, compresslevel=compresslevel) as archive:
+        ExcelWriter(wb, archive).save()
+
+def _collect_worklog_futures(futures: List["Future[List[Row]]"], linhas_all: List[Row]) -> None:
+    """Gather worker results into linhas_all as they complete, reporting failed issues.
+
+    The progress bar is advanced in batches of 16 completions plus a final flush.
+    """
+    with _progress_bar(len(futures)) as pbar:
+        done = 0  # completions not yet reported; flushed in batches
+        for fut in as_completed(futures):
+            try:
+                linhas_all.extend(fut.result())
+            except requests.exceptions.SSLError as e:
+                sys.stderr.write(f"ERRO SSL em uma issue: {e}\n")
+            except Exception as e:
+                sys.stderr.write(f"AVISO: falha em uma issue: {e}\n")
+            finally:
+                done += 1
+                if done >= 16:
+                    pbar.update(done)
+                    done = 0
+        pbar.update(done)
+
+def _write_reports_concurrently(write_full: Callable[[], None], write_short: Callable[[], None]) -> None:
+    """Run write_short on a helper thread while write_full runs here; re-raise the first failure.
+
+    Both writers only read the finished rowset. Row serialization holds the
+    GIL, but deflate and file I/O release it, so the two saves partly overlap.
+    """
+    errors: List[BaseException] = []
+
+    def run_short() -> None:
+        try:
+            write_short()
+        except BaseException as e:  # re-raised in the calling thread below
+            errors.append(e)
+
+    t = threading.Thread(target=run_short, name="xlsx-short", daemon=True)
+    t.start()
+    try:
+        write_full()
+    finally:
+        t.join()
+    if errors:
+        raise errors[0]
+
+def main() -> None:
     """Program entry point to orchestrate extraction and export."""
     args = parse_args()
     cfg = read_config(args.config)
@@ -638,10 +1318,12 @@ def main():
         print("JQL:", jql)
 
     ses = make_session(email, token, verify=verify_val, ca_bundle=ca_bundle,
-                       http_proxy=http_proxy, https_proxy=https_proxy)
+                       http_proxy=http_proxy, https_proxy=https_proxy, max_workers=max_workers)
 
     try:
-        sow_ok = ensure_field_exists(ses, base_url, sow_field_id_eff, timeout=timeout, verbose=verbose)
+        field_cache = "" if getattr(args, "no_field_cache", False) else default_field_cache_path()
+        sow_ok = ensure_field_exists(ses, base_url, sow_field_id_eff, timeout=timeout, verbose=verbose,
+                                     cache_path=field_cache)
     except requests.exceptions.SSLError:
         print("ERRO SSL persistente ao validar campos. Tente configurar verify_ssl=false, --insecure ou ca_bundle.", file=sys.stderr)
         raise
@@ -650,52 +1332,70 @@ def main():
     if sow_ok:
         fields_list.append(sow_field_id_eff)
 
-    issues = post_search_jql(ses, base_url, jql, fields_list, timeout=timeout, verbose=verbose)
+    issues = post_search_jql_parallel(ses, base_url, start_utc, end_utc, fields_list, timeout=timeout,
+                                      max_workers=max_workers, verbose=verbose)
     vprint(verbose, f"Total de issues para processar: {len(issues)}")
 
-    def session_factory():
-        """Factory to create a configured requests.Session for concurrent calls."""
-        return make_session(email, token, verify=verify_val, ca_bundle=ca_bundle,
-                            http_proxy=http_proxy, https_proxy=https_proxy)
-
-    linhas_all: List[Dict[str, Any]] = []
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [
-            executor.submit(
-                fetch_worklogs_for_issue, base_url, session_factory, issue, start_utc, end_utc, timeout
-            )
-            for issue in issues
-        ]
-        with tqdm(total=len(futures), desc="Processando issues", unit="issue") as pbar:
-            for fut in as_completed(futures):
-                try:
-                    linhas_all.extend(fut.result())
-                except requests.exceptions.SSLError as e:
-                    sys.stderr.write(f"ERRO SSL em uma issue: {e}\n")
-                except Exception as e:
-                    sys.stderr.write(f"AVISO: falha em uma issue: {e}\n")
-                finally:
-                    pbar.update(1)
+    linhas_all: List[Row] = []
+    pending = issues
+    if getattr(args, "bulk_worklogs", False):
+        linhas_all, pending = fetch_worklogs_bulk(base_url, ses, issues, start_utc, end_utc, timeout, verbose=verbose)
+        vprint(verbose, f"Issues sem worklogs no lote (busca individual): {len(pending)}")
+
+    use_async = getattr(args, "use_async", False)
+    if use_async:
+        try:
+            with _progress_bar(len(pending)) as pbar:
+                linhas_all.extend(fetch_worklogs_async(
+                    base_url, email, token, pending, start_utc, end_utc, timeout, max_workers,
+                    verify=verify_val, ca_bundle=ca_bundle, http_proxy=http_proxy, https_proxy=https_proxy,
+                    progress=pbar,
+                ))
+        except ImportError:
+            sys.stderr.write("AVISO: --async requer o pacote httpx (pip install .[async]). Usando threads.\n")
+            use_async = False
+
+    if not use_async:
+        # Set on Ctrl+C so workers stop retry waits and paging instead of holding up shutdown.
+        cancel_event = threading.Event()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    fetch_worklogs_for_issue, base_url, ses, issue, start_utc, end_utc, timeout, cancel_event
+                )
+                for issue in pending
+            ]
+            try:
+                _collect_worklog_futures(futures, linhas_all)
+            except KeyboardInterrupt:
+                # Drop queued issues first, then release workers blocked in retry waits.
+                executor.shutdown(wait=False, cancel_futures=True)
+                cancel_event.set()
+                sys.stderr.write("AVISO: interrompido pelo usuário; aguardando requisições em andamento...\n")
+                sys.exit(130)
 
     out_path = args.out.strip() or default_out_name()
     if not out_path.lower().endswith(".xlsx"):
         out_path += ".xlsx"
 
-    df = pd.DataFrame(linhas_all, columns=COLS)
+    compresslevel = getattr(args, "xlsx_compresslevel", 1)
+
     # Ensure output directory exists and write Excel files safely
     try:
         os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
-        with pd.ExcelWriter(out_path, engine="openpyxl") as writer:
-            df.to_excel(writer, index=False, sheet_name="Relatório")
 
         # --- New: short file ---
-        short_df = df[SHORT_COLS].copy()
         base_dir = os.path.dirname(out_path) or "."
         base_name = os.path.basename(out_path)
         root, ext = os.path.splitext(base_name)
         short_name = os.path.join(base_dir, f"{root}_short{ext}")
-        with pd.ExcelWriter(short_name, engine="openpyxl") as writer:
-            short_df.to_excel(writer, index=False, sheet_name="Relatório")
+
+        # Project the already-built rows lazily: no second copy of the rowset.
+        _write_reports_concurrently(
+            lambda: write_xlsx_streaming(out_path, COLS, linhas_all, compresslevel=compresslevel),
+            lambda: write_xlsx_streaming(short_name, SHORT_COLS, map(_SHORT_ROW, linhas_all),
+                                         compresslevel=compresslevel, prefer_xlsxwriter=True),
+        )
     except Exception as e:
         sys.stderr.write(f"ERRO: falha ao escrever arquivos Excel: {e}\n")
         sys.exit(4)
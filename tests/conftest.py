@@ -10,12 +10,40 @@ for p in (SRC_DIR, ROOT_DIR):
 
 # Route legacy module name to the single source of truth (package core)
 # This keeps existing tests importing mJiraWorkLogExtractor working without duplicating code.
+# The alias resolves on first import, so core (requests, openpyxl, ...) loads only when a
+# test module needs it, not when conftest is imported by each xdist worker. A meta path
+# alias is used instead of importlib.util.LazyLoader: coverage's startup walks sys.modules
+# via inspect, which would materialize a lazy module before tracing begins.
 import importlib
-_core_mod = importlib.import_module("jira_worklog_extractor.core")
-sys.modules["mJiraWorkLogExtractor"] = _core_mod
+import importlib.abc
+import importlib.util
 
-import types
+
+class _LegacyAlias(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    name = "mJiraWorkLogExtractor"
+    target = "jira_worklog_extractor.core"
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname != self.name:
+            return None
+        return importlib.util.spec_from_loader(fullname, self)
+
+    def create_module(self, spec):
+        module = importlib.import_module(self.target)
+        self._target_spec = module.__spec__
+        return module
+
+    def exec_module(self, module):
+        # Already executed as core; undo the import system rebinding __spec__ to the alias.
+        module.__spec__ = self._target_spec
+
+
+if not any(isinstance(f, _LegacyAlias) for f in sys.meta_path):
+    sys.meta_path.insert(0, _LegacyAlias())
+
+import functools
 import time as _time
+import types
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
@@ -23,7 +51,12 @@ import pytest
 import requests
 
 
+_EMPTY: Dict[str, str] = {}  # shared default headers; callers never mutate it
+
+
 class FakeResponse:
+    __slots__ = ("status_code", "_json_data", "text", "headers", "_raise_exc")
+
     def __init__(
         self,
         status_code: int = 200,
@@ -35,28 +68,108 @@ class FakeResponse:
         self.status_code = status_code
         self._json_data = json_data
         self.text = text
-        self.headers = headers or {}
+        self.headers = headers or _EMPTY
         self._raise_exc = raise_for_status_exc
 
+    @classmethod
+    def ok(cls, json_data: Any = None) -> "FakeResponse":
+        return cls(200, json_data)
+
+    @classmethod
+    def err(cls, status: int) -> "FakeResponse":
+        return cls(status, raise_for_status_exc=make_http_error(status))
+
     def json(self):
         return self._json_data
 
     def raise_for_status(self):
         if self._raise_exc is not None:
-            raise self._raise_exc
+            # Errors may be shared (make_http_error is cached): drop the previous traceback
+            raise self._raise_exc.with_traceback(None)
         if 400 <= self.status_code:
             err = requests.HTTPError(f"HTTP {self.status_code}")
             # attach minimal response info for code under test
-            err.response = types.SimpleNamespace(status_code=self.status_code, text=self.text)
+            err.response = _Resp(self.status_code, self.text)
             raise err
 
 
+class _Resp:
+    """Minimal response info attached to HTTPError, as code under test reads it."""
+
+    __slots__ = ("status_code", "text")
+
+    def __init__(self, status_code: int, text: str):
+        self.status_code = status_code
+        self.text = text
+
+
+@functools.lru_cache(maxsize=32)
 def make_http_error(status: int) -> requests.HTTPError:
+    """Return the shared HTTPError for status (cached: tests only read err.response)."""
     err = requests.HTTPError(f"HTTP {status}")
-    err.response = types.SimpleNamespace(status_code=status, text=f"{status} error")
+    err.response = _Resp(status, f"{status} error")
     return err
 
 
+class StubSession:
+    """Session double serving canned responses in order.
+
+    Each call is recorded as (method, url, params or json, headers). A canned
+    exception instance is raised instead of returned.
+    """
+
+    __slots__ = ("_g", "_p", "calls")
+
+    def __init__(self, gets=(), posts=()):
+        self._g = iter(gets)
+        self._p = iter(posts)
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None, headers=None, **_kw):
+        self.calls.append(("GET", url, params, headers))
+        return self._serve(next(self._g))
+
+    def post(self, url, json=None, timeout=None, headers=None, **_kw):
+        self.calls.append(("POST", url, json, headers))
+        return self._serve(next(self._p))
+
+    @staticmethod
+    def _serve(item):
+        if isinstance(item, BaseException):
+            raise item
+        return item
+
+
+class StubXlsxWriter:
+    """Drop-in for write_xlsx_streaming that keeps {path: (columns, rows)} instead of writing files."""
+
+    __slots__ = ("files",)
+
+    def __init__(self):
+        self.files = {}
+
+    def __call__(self, path, columns, rows_iter, **_kw):
+        self.files[str(path)] = (list(columns), list(rows_iter))
+
+
+@pytest.fixture(scope="module")
+def stub_xlsx():
+    """Replace write_xlsx_streaming with a StubXlsxWriter once for a whole test module.
+
+    Tests that need the writer to fail patch it again with their own monkeypatch.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        writer = StubXlsxWriter()
+        mp.setattr(importlib.import_module("jira_worklog_extractor.core"), "write_xlsx_streaming", writer)
+        yield writer
+
+
+@pytest.fixture(autouse=True)
+def fresh_field_memo(monkeypatch):
+    """Give every test an empty in-process SoW field memo, so base URLs can repeat across tests."""
+    monkeypatch.setattr(importlib.import_module("jira_worklog_extractor.core"), "_FIELD_EXISTS", {})
+
+
 @pytest.fixture
 def no_sleep(monkeypatch):
     """Make time.sleep a no-op for faster retry tests."""
@@ -64,10 +177,13 @@ def no_sleep(monkeypatch):
     yield
 
 
-@pytest.fixture
-def tmp_config_file(tmp_path):
-    """Create a minimal valid config.ini and return its path."""
-    p = tmp_path / "config.ini"
+@pytest.fixture(scope="module")
+def tmp_config_file(tmp_path_factory):
+    """Create a minimal valid config.ini once per test module and return its path.
+
+    Tests only read it; write a config of your own under tmp_path to vary it.
+    """
+    p = tmp_path_factory.mktemp("cfg") / "config.ini"
     p.write_text(
         "[jira]\n"
         "base_url = https://example.atlassian.net\n"
@@ -79,5 +195,30 @@ def tmp_config_file(tmp_path):
     return p
 
 
+@pytest.fixture
+def base_parsed_args(tmp_config_file, tmp_path):
+    """Fresh parse_args() result for main(); tests override only the fields they need."""
+    return types.SimpleNamespace(
+        config=str(tmp_config_file),
+        out=str(tmp_path / "report.xlsx"),
+        verbose=False,
+        max_workers=1,
+        timeout=5,
+        insecure=False,
+        sow_field_id="",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Pin tests that flip process-wide state (os.name, the Windows trust memo) to one xdist worker.
+
+    Everything else is independent and spreads across workers. Note that
+    no_sleep is worker-safe: it only patches time.sleep in its own process.
+    """
+    for item in items:
+        if "win_trust" in item.name or "reload" in item.name:
+            item.add_marker(pytest.mark.xdist_group("reload"))
+
+
 # Expose utilities for tests
-__all__ = ["FakeResponse", "make_http_error"]
+__all__ = ["FakeResponse", "StubSession", "StubXlsxWriter", "make_http_error"]
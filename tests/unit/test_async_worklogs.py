@@ -0,0 +1,194 @@
+import asyncio
+import json
+import sys
+import types
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+import mJiraWorkLogExtractor as mod
+from tests.conftest import StubXlsxWriter
+
+
+class AsyncResp:
+    def __init__(self, status_code=200, payload=None, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = json.dumps(payload or {}).encode("utf-8")
+
+
+class FakeAsyncClient:
+    """Serves /worklog pages per issue key; keys in `fail` raise."""
+
+    def __init__(self, pages, fail=(), throttle_once=()):
+        self.pages = pages
+        self.fail = set(fail)
+        self.throttle = set(throttle_once)
+        self.calls = []
+
+    async def get(self, url, params=None, timeout=None):
+        key = url.rsplit("/", 2)[-2]
+        self.calls.append((key, params["startAt"]))
+        if key in self.fail:
+            raise RuntimeError(f"boom {key}")
+        if key in self.throttle:
+            self.throttle.discard(key)
+            return AsyncResp(429, headers={"Retry-After": "0"})
+        if key not in self.pages:
+            return AsyncResp(404)
+        return AsyncResp(200, self.pages[key][params["startAt"]])
+
+
+START = datetime(2025, 10, 1, tzinfo=mod.DEFAULT_TZ)
+END = datetime(2025, 10, 25, tzinfo=mod.DEFAULT_TZ)
+
+
+def _wl(day, secs=3600):
+    return {"started": f"2025-10-{day:02d}T10:00:00.000+0000", "author": {"displayName": "A"},
+            "timeSpentSeconds": secs, "comment": "c"}
+
+
+def test_fetch_all_worklogs_async_paginates_retries_and_skips_failures(capsys):
+    pages = {
+        "T-1": {0: {"worklogs": [_wl(2)], "total": 2}, 1: {"worklogs": [_wl(3)], "total": 2}},
+        "T-2": {0: {"worklogs": [_wl(4), {"started": "2025-11-01T00:00:00.000+0000"}], "total": 2}},
+    }
+    client = FakeAsyncClient(pages, fail={"T-3"}, throttle_once={"T-2"})
+    issues = [{"key": k, "fields": {"summary": k}} for k in ("T-1", "T-2", "T-3", "T-4")]
+    progress = SimpleNamespace(n=0, update=lambda n: setattr(progress, "n", progress.n + n))
+
+    rows = asyncio.run(mod.fetch_all_worklogs_async(client, "https://x", issues, START, END, 5,
+                                                    max_in_flight=2, progress=progress))
+
+    assert sorted((r[2], r[6]) for r in rows) == [("T-1", "2025-10-02"), ("T-1", "2025-10-03"), ("T-2", "2025-10-04")]
+    assert client.calls.count(("T-2", 0)) == 2  # 429 retried
+    assert progress.n == 4
+    err = capsys.readouterr().err
+    assert "boom T-3" in err and "T-4 retornou status 404" in err
+
+
+def test_async_issue_pages_after_the_first_are_requested_together(monkeypatch, capsys):
+    state = {"now": 0, "peak": 0}
+    pages = {off: {"worklogs": [_wl(2 + off // 2), _wl(2 + off // 2)], "total": 8} for off in (0, 2, 4, 6)}
+    pages[4] = None
+
+    class PagedClient:
+        async def get(self, url, params=None, timeout=None):
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+            await asyncio.sleep(0)
+            state["now"] -= 1
+            assert params["maxResults"] == (mod.PAGE_SIZE if params["startAt"] == 0 else 2)
+            page = pages[params["startAt"]]
+            return AsyncResp(500 if page is None else 200, page)
+
+    monkeypatch.setattr(mod, "RETRY_BACKOFF_CAP", 0.0)
+    rows = asyncio.run(mod.fetch_worklogs_for_issue_async(PagedClient(), "https://x", {"key": "T-1", "fields": {}},
+                                                         START, END, 5))
+
+    assert state["peak"] == 3  # offsets 2, 4 and 6 in flight together
+    assert [r[6] for r in rows] == ["2025-10-02"] * 2 + ["2025-10-03"] * 2  # page order kept, stops at the failed page
+    assert "T-1 retornou status 500" in capsys.readouterr().err
+
+
+def test_async_fan_out_respects_max_in_flight():
+    state = {"now": 0, "peak": 0}
+
+    class SlowClient:
+        async def get(self, url, params=None, timeout=None):
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+            await asyncio.sleep(0)
+            state["now"] -= 1
+            return AsyncResp(200, {"worklogs": []})
+
+    issues = [{"key": f"T-{i}", "fields": {}} for i in range(10)]
+    asyncio.run(mod.fetch_all_worklogs_async(SlowClient(), "https://x", issues, START, END, 5, max_in_flight=3))
+    assert state["peak"] == 3
+
+
+def test_make_async_client_mirrors_session_settings(monkeypatch, tmp_path):
+    captured = {}
+    fake_httpx = types.SimpleNamespace(
+        AsyncClient=lambda **kw: captured.update(kw) or "client",
+        Limits=lambda **kw: ("limits", kw),
+    )
+    monkeypatch.setitem(sys.modules, "httpx", fake_httpx)
+    monkeypatch.setattr(mod, "_ensure_win_trust", lambda: True)
+
+    assert mod.make_async_client("e", "t", verify=True, https_proxy="http://p:1", max_workers=3) == "client"
+    assert captured["auth"] == ("e", "t")
+    assert captured["verify"] is True
+    assert captured["proxy"] == "http://p:1"
+    assert captured["limits"] == ("limits", {"max_connections": 12, "max_keepalive_connections": 12})
+
+    monkeypatch.setattr(mod.ssl, "create_default_context", lambda cafile: ("ctx", cafile))
+    captured.clear()
+    mod.make_async_client("e", "t", ca_bundle="/ca.pem")
+    assert captured["verify"] == ("ctx", "/ca.pem")
+    assert "proxy" not in captured
+
+
+def test_fetch_worklogs_async_runs_client_as_context_manager(monkeypatch):
+    events = []
+
+    class CM(FakeAsyncClient):
+        async def __aenter__(self):
+            events.append("open")
+            return self
+
+        async def __aexit__(self, *exc):
+            events.append("close")
+
+    client = CM({"T-1": {0: {"worklogs": [_wl(5)], "total": 1}}})
+    monkeypatch.setattr(mod, "make_async_client", lambda *a, **k: client)
+    rows = mod.fetch_worklogs_async("https://x", "e", "t", [{"key": "T-1", "fields": {}}], START, END, 5, max_workers=2)
+    assert [r[2] for r in rows] == ["T-1"]
+    assert events == ["open", "close"]
+
+
+@pytest.mark.parametrize("httpx_missing", [False, True])
+def test_main_async_flag_uses_event_loop_or_falls_back(monkeypatch, tmp_path, tmp_config_file, capsys, httpx_missing):
+    monkeypatch.setattr(mod, "parse_args", lambda: SimpleNamespace(
+        config=str(tmp_config_file), out=str(tmp_path / "r.xlsx"), verbose=False,
+        max_workers=2, timeout=5, insecure=False, use_async=True,
+    ))
+    monkeypatch.setattr(mod, "ensure_field_exists", lambda *a, **k: True)
+    monkeypatch.setattr(mod, "post_search_jql", lambda *a, **k: [{"key": "T-1", "fields": {}}])
+    row = ("P", "", "T-1", "S", "", "", "2025-10-10", "A", 1.0, "")
+
+    def fake_async(*a, **k):
+        if httpx_missing:
+            raise ImportError("No module named 'httpx'")
+        k["progress"].update(1)
+        return [row]
+
+    monkeypatch.setattr(mod, "fetch_worklogs_async", fake_async)
+    threaded = []
+    monkeypatch.setattr(mod, "fetch_worklogs_for_issue", lambda *a, **k: threaded.append(1) or [row])
+    writer = StubXlsxWriter()
+    monkeypatch.setattr(mod, "write_xlsx_streaming", writer)
+
+    mod.main()
+
+    assert writer.files[str(tmp_path / "r.xlsx")][1] == [row]
+    assert threaded == ([1] if httpx_missing else [])
+    assert ("httpx" in capsys.readouterr().err) is httpx_missing
+
+
+def test_async_fan_out_bounds_page_requests_not_issues():
+    state = {"now": 0, "peak": 0}
+
+    class PagedClient:
+        async def get(self, url, params=None, timeout=None):
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+            await asyncio.sleep(0)
+            state["now"] -= 1
+            return AsyncResp(200, {"worklogs": [_wl(2)], "total": 5})
+
+    issues = [{"key": f"T-{i}", "fields": {}} for i in range(4)]
+    rows = asyncio.run(mod.fetch_all_worklogs_async(PagedClient(), "https://x", issues, START, END, 5, max_in_flight=2))
+    assert state["peak"] == 2  # each issue gathers 4 more pages, yet only 2 requests run at once
+    assert len(rows) == 20
@@ -2,8 +2,6 @@ import os
 import re
 from types import SimpleNamespace
 
-import pandas as pd
-
 import mJiraWorkLogExtractor as mod
 
 
@@ -73,20 +71,14 @@ def test_main_verbose_prints_interval_and_jql_and_uses_default_out(monkeypatch,
         "Tempo Gasto (h)": 1.25,
         "Descrição do Trabalho": "Did stuff",
     }
-    monkeypatch.setattr(mod, "fetch_worklogs_for_issue", lambda *a, **k: [row])
+    monkeypatch.setattr(mod, "fetch_worklogs_for_issue", lambda *a, **k: [tuple(row[c] for c in mod.COLS)])
 
     created_paths = []
 
-    class DummyWriter:
-        def __init__(self, path, engine=None):
-            created_paths.append(str(path))
-        def __enter__(self):
-            return self
-        def __exit__(self, exc_type, exc, tb):
-            return False
+    def fake_write(path, columns, rows_iter, **_k):
+        created_paths.append(str(path))
 
-    monkeypatch.setattr(pd, "ExcelWriter", DummyWriter)
-    monkeypatch.setattr(pd.DataFrame, "to_excel", lambda self, writer, index=False, sheet_name="Relatório": None)
+    monkeypatch.setattr(mod, "write_xlsx_streaming", fake_write)
 
     mod.main()
     out = capsys.readouterr().out
@@ -96,9 +88,9 @@ def test_main_verbose_prints_interval_and_jql_and_uses_default_out(monkeypatch,
     assert "JQL:" in out
 
     # Ensure default_out_name pattern was used and short file created
-    # created_paths[0] is the full report path (first ExcelWriter call in main)
+    # Both reports are written concurrently: pick the full one by name, not by call order
     assert created_paths, "No Excel files were recorded"
-    full_path = created_paths[0]
+    full_path = next(p for p in created_paths if not p.endswith("_short.xlsx"))
     assert full_path.endswith(".xlsx")
     base = os.path.basename(full_path)
     assert re.match(r"^mJiraWorkLogExtractor-\d{4}-\d{2}-\d{2}-\d{4}\.xlsx$", base)
@@ -29,3 +29,24 @@ def test_read_config_missing_section_exits(tmp_path):
     with pytest.raises(SystemExit) as ei:
         core.read_config(str(cfg))
     assert ei.value.code == 2
+
+
+def test_package_import_is_lazy_and_legacy_shim_resolves_core():
+    import subprocess
+    import sys
+
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([os.path.join(root, "src"), root]))
+    code = (
+        "import sys, jira_worklog_extractor as pkg\n"
+        "assert 'jira_worklog_extractor.core' not in sys.modules and 'requests' not in sys.modules\n"
+        "assert callable(pkg.main) and 'jira_worklog_extractor.core' in sys.modules\n"
+        "assert 'openpyxl' not in sys.modules  # loaded by write_xlsx_streaming only\n"
+        "assert pkg._WIN_TRUST_CHECKED is False  # trust store untouched until make_session\n"
+        "import mJiraWorkLogExtractor as legacy\n"
+        "assert legacy.main is pkg.main and legacy.COLS[0] == 'Projeto'\n"
+        "try:\n    pkg.no_such_name\nexcept AttributeError:\n    print('ok')\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, cwd=root)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.strip() == "ok"
@@ -1,67 +1,75 @@
+import re
 from types import SimpleNamespace
 from datetime import datetime
 import pytest
-import pandas as pd
 import requests
 
 import mJiraWorkLogExtractor as mod
+from tests.conftest import FakeResponse, StubSession
 
 
-def test_adf_to_text_heading_hardbreak_and_ordered_list():
-    adf = {
-        "type": "doc",
-        "content": [
-            {"type": "heading", "content": [{"type": "text", "text": "Title"}]},
-            {
-                "type": "paragraph",
-                "content": [
-                    {"type": "text", "text": "Line1"},
-                    {"type": "hardBreak"},
-                    {"type": "text", "text": "Line2"},
-                ],
-            },
-            {
-                "type": "orderedList",
-                "content": [
-                    {
-                        "type": "listItem",
-                        "content": [
-                            {"type": "paragraph", "content": [{"type": "text", "text": "First"}]}
-                        ],
-                    }
-                ],
-            },
-        ],
-    }
-    txt = mod.adf_to_text(adf)
-    assert "Title" in txt
-    assert "Line1" in txt and "Line2" in txt
-    # list items are prefixed with "- "
-    assert "- First" in txt
+_HARDBREAK_RE = re.compile(r"Line1\r?\nLine2")
+_LIST_ITEM_RE = re.compile(r"^- First$", re.M)
 
+# Parsed once at import; the walker runs once per module via full_adf_text.
+_ADF_FULL = {
+    "type": "doc",
+    "content": [
+        {"type": "heading", "content": [{"type": "text", "text": "Title"}]},
+        {
+            "type": "paragraph",
+            "content": [
+                {"type": "text", "text": "Line1"},
+                {"type": "hardBreak"},
+                {"type": "text", "text": "Line2"},
+            ],
+        },
+        {
+            "type": "orderedList",
+            "content": [
+                {
+                    "type": "listItem",
+                    "content": [
+                        {"type": "paragraph", "content": [{"type": "text", "text": "First"}]}
+                    ],
+                }
+            ],
+        },
+    ],
+}
 
-def test_ensure_field_exists_ssl_error_reraises():
-    class Sess:
-        def get(self, url, timeout=None):
-            raise requests.exceptions.SSLError("bad ssl")
 
-    with pytest.raises(requests.exceptions.SSLError):
-        mod.ensure_field_exists(Sess(), "https://example", mod.SOW_FIELD_ID, timeout=1)
+@pytest.fixture(scope="module")
+def full_adf_text():
+    return mod.adf_to_text(_ADF_FULL)
+
+
+@pytest.fixture(scope="module")
+def full_adf_lines(full_adf_text):
+    return {line.strip() for line in full_adf_text.splitlines()}
+
+
+def test_adf_to_text_heading(full_adf_lines):
+    assert "Title" in full_adf_lines
 
 
-def test_http_get_with_retry_ssl_error_reraises():
-    class Sess:
-        def get(self, url, params=None, timeout=None):
-            raise requests.exceptions.SSLError("oops")
+def test_adf_to_text_hardbreak_splits_lines(full_adf_text):
+    assert _HARDBREAK_RE.search(full_adf_text) is not None
 
+
+def test_adf_to_text_ordered_list_items_prefixed(full_adf_text):
+    # list items are prefixed with "- "
+    assert _LIST_ITEM_RE.search(full_adf_text) is not None
+
+
+def test_ensure_field_exists_ssl_error_reraises():
+    sess = StubSession(gets=[requests.exceptions.SSLError("bad ssl")])
     with pytest.raises(requests.exceptions.SSLError):
-        mod.http_get_with_retry(Sess(), "https://x")
+        mod.ensure_field_exists(sess, "https://example", mod.SOW_FIELD_ID, timeout=1)
 
 
-def test_fetch_worklogs_pagination(monkeypatch):
+def test_fetch_worklogs_pagination():
     # Two pages: first returns 1 WL with total=2, second returns 1 WL, then loop stops
-    calls = {"n": 0}
-
     wl1 = {
         "started": "2025-10-10T10:00:00.000+0000",
         "author": {"displayName": "Dev1"},
@@ -75,61 +83,27 @@ def test_fetch_worklogs_pagination(monkeypatch):
         "comment": "C2",
     }
 
-    class Resp:
-        def __init__(self, wls, total, status=200):
-            self._json = {"worklogs": wls, "total": total}
-            self.status_code = status
-        def json(self):
-            return self._json
-        def raise_for_status(self):
-            if self.status_code >= 400:
-                raise requests.HTTPError(f"HTTP {self.status_code}")
-
-    def fake_get(_sess, url, params=None, timeout=None):
-        calls["n"] += 1
-        if calls["n"] == 1:
-            return Resp([wl1], total=2)
-        elif calls["n"] == 2:
-            return Resp([wl2], total=2)
-        return Resp([], total=2)
-
-    monkeypatch.setattr(mod, "http_get_with_retry", fake_get)
-
-    def session_factory():
-        class Dummy: ...
-        return Dummy()
+    sess = StubSession(gets=[FakeResponse.ok({"worklogs": [wl], "total": 2}) for wl in (wl1, wl2)])
 
     issue = {"key": "KEY-1", "fields": {"summary": "S", "project": {"name": "P"}, "issuetype": {"name": "T"}, "priority": {"name": "M"}}}
     start_utc = datetime(2025, 10, 1, 0, 0, tzinfo=mod.DEFAULT_TZ)
     end_utc = datetime(2025, 10, 25, 0, 0, tzinfo=mod.DEFAULT_TZ)
-    rows = mod.fetch_worklogs_for_issue("https://example", session_factory, issue, start_utc, end_utc, timeout=5)
+    rows = [dict(zip(mod.COLS, r)) for r in mod.fetch_worklogs_for_issue("https://example", sess, issue, start_utc, end_utc, timeout=5)]
     assert len(rows) == 2
+    assert [c[2]["startAt"] for c in sess.calls] == [0, 1]
     assert {r["Nome de Exibição"] for r in rows} == {"Dev1", "Dev2"}
 
 
 def test_fetch_worklogs_error_status_breaks(monkeypatch):
-    class Resp:
-        def __init__(self, status=500):
-            self.status_code = status
-            self.text = "err"
-        def json(self):
-            return {}
-        def raise_for_status(self):
-            raise requests.HTTPError("boom")
-
-    def fake_get(_sess, url, params=None, timeout=None):
-        return Resp(500)
+    def fake_get(_sess, url, params=None, timeout=None, **_kw):
+        return FakeResponse.err(500)
 
     monkeypatch.setattr(mod, "http_get_with_retry", fake_get)
 
-    def session_factory():
-        class Dummy: ...
-        return Dummy()
-
     issue = {"key": "KEY-1", "fields": {}}
     start_utc = datetime(2025, 10, 1, 0, 0, tzinfo=mod.DEFAULT_TZ)
     end_utc = datetime(2025, 10, 25, 0, 0, tzinfo=mod.DEFAULT_TZ)
-    rows = mod.fetch_worklogs_for_issue("https://example", session_factory, issue, start_utc, end_utc, timeout=5)
+    rows = mod.fetch_worklogs_for_issue("https://example", object(), issue, start_utc, end_utc, timeout=5)
     assert rows == []
 
 
@@ -147,3 +121,53 @@ def test_read_config_errors(tmp_path):
     with pytest.raises(SystemExit) as ei2:
         mod.read_config(str(p2))
     assert ei2.value.code == 2
+
+
+def test_retry_delay_decorrelated_jitter_bounds(monkeypatch):
+    r = SimpleNamespace(headers={})
+    seen = []
+    monkeypatch.setattr(mod.random, "uniform", lambda lo, hi: seen.append((lo, hi)) or hi)
+    assert mod._retry_delay(r, prev=0.5, backoff_base=0.5) == 1.5
+    assert mod._retry_delay(r, prev=100.0, backoff_base=0.5) == mod.RETRY_BACKOFF_CAP
+    assert seen == [(0.5, 1.5), (0.5, 300.0)]
+    # Retry-After wins, garbage falls back to jitter
+    assert mod._retry_delay(SimpleNamespace(headers={"Retry-After": "2"}), 0.5, 0.5) == 2.0
+    assert mod._retry_delay(SimpleNamespace(headers={"Retry-After": "soon"}), 0.5, 0.5) == 1.5
+
+
+def test_retry_sleeps_only_between_attempts(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(mod.time, "sleep", sleeps.append)
+    monkeypatch.setattr(mod.random, "uniform", lambda lo, hi: hi)
+
+    # Retry-After: 0 retries immediately without sleeping
+    s = StubSession(gets=[FakeResponse(429, headers={"Retry-After": "0"}), FakeResponse.ok()])
+    assert mod.http_get_with_retry(s, "https://x", timeout=1).status_code == 200
+    assert sleeps == []
+
+    # Persistent 500: waits grow by jitter, none after the final attempt
+    s = StubSession(posts=[FakeResponse(500)] * 3)
+    assert mod.http_post_with_retry(s, "https://x", json={}, timeout=1, max_tries=3, backoff_base=0.5).status_code == 500
+    assert sleeps == [1.5, 4.5]
+
+
+def test_retry_wait_uses_cancel_event_and_stops_once_set(monkeypatch):
+    monkeypatch.setattr(mod.time, "sleep", lambda *_: pytest.fail("time.sleep used despite cancel_event"))
+    waits = []
+
+    class Event:
+        def __init__(self, fire_on):
+            self.fire_on = fire_on
+
+        def wait(self, delay):
+            waits.append(delay)
+            return len(waits) >= self.fire_on
+
+    sess = StubSession(gets=[FakeResponse.err(503)] * 2 + [FakeResponse.ok({})])
+    assert mod.http_get_with_retry(sess, "https://x", timeout=1, cancel_event=Event(fire_on=9)).status_code == 200
+    assert len(waits) == 2
+
+    waits.clear()
+    sess = StubSession(gets=[FakeResponse.err(503)] * 5)
+    assert mod.http_get_with_retry(sess, "https://x", timeout=1, cancel_event=Event(fire_on=1)).status_code == 503
+    assert len(sess.calls) == 1 and len(waits) == 1
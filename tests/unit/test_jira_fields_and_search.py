@@ -1,10 +1,13 @@
+import json
+import os
+import sys
 from types import SimpleNamespace
 from datetime import datetime, timezone
 import requests
 import pytest
 
 import mJiraWorkLogExtractor as mod
-from tests.conftest import FakeResponse, make_http_error
+from tests.conftest import FakeResponse, StubSession, make_http_error
 
 
 def test_make_session_configures_auth_proxies_and_verify():
@@ -27,65 +30,102 @@ def test_make_session_configures_auth_proxies_and_verify():
     assert s2.verify == "C:/root.pem"
 
 
-def test_http_get_with_retry_retries_429_then_success(no_sleep):
-    # Prepare a fake session producing 429 then 200
-    calls = {"count": 0}
-
-    class Sess:
-        def get(self, url, params=None, timeout=None):
-            calls["count"] += 1
-            if calls["count"] == 1:
-                return FakeResponse(
-                    status_code=429,
-                    headers={"Retry-After": "0"},
-                    json_data={"msg": "rate limit"},
-                )
-            return FakeResponse(status_code=200, json_data={"ok": True})
-
-    s = Sess()
-    r = mod.http_get_with_retry(s, "http://x", timeout=1, max_tries=3, backoff_base=0.01)
-    assert r.status_code == 200
-    assert calls["count"] == 2
-
-
-def test_http_get_with_retry_returns_error_after_max_retries(no_sleep):
-    class Sess:
-        def get(self, url, params=None, timeout=None):
-            return FakeResponse(status_code=500, json_data={"err": "server"})
-
-    s = Sess()
-    r = mod.http_get_with_retry(s, "http://x", timeout=1, max_tries=2, backoff_base=0.0)
-    # returns the last response even if it's an error
-    assert r is not None
-    assert r.status_code == 500
+_RETRY_SCENARIOS = {
+    # 429 (Retry-After: 0) is retried, then succeeds
+    "429_then_200": ([FakeResponse(429, {"msg": "rate limit"}, headers={"Retry-After": "0"}), FakeResponse.ok({"ok": True})], 200, 2),
+    # persistent 5xx: the last error response is returned, not raised
+    "500_persist": ([FakeResponse(500, {"err": "server"})] * 2, 500, 2),
+    # TLS failures are never retried
+    "ssl": ([requests.exceptions.SSLError("ssl boom")], requests.exceptions.SSLError, 1),
+}
+
+
+@pytest.mark.parametrize(
+    "send,stub_kw,extra",
+    [
+        (mod.http_get_with_retry, "gets", {}),
+        (mod.http_post_with_retry, "posts", {"json": {}}),
+    ],
+    ids=["get", "post"],
+)
+@pytest.mark.parametrize("scenario", list(_RETRY_SCENARIOS))
+def test_http_retry_scenarios(scenario, send, stub_kw, extra, no_sleep):
+    responses, expected, attempts = _RETRY_SCENARIOS[scenario]
+    s = StubSession(**{stub_kw: responses})
+
+    if isinstance(expected, type):
+        with pytest.raises(expected):
+            send(s, "http://x", timeout=1, max_tries=2, backoff_base=0.0, **extra)
+    else:
+        assert send(s, "http://x", timeout=1, max_tries=2, backoff_base=0.0, **extra).status_code == expected
+    assert len(s.calls) == attempts
 
 
 def test_ensure_field_exists_true_and_false(monkeypatch):
     # True case: field present
-    class Sess1:
-        def get(self, url, timeout=None):
-            return FakeResponse(status_code=200, json_data=[{"id": mod.SOW_FIELD_ID}, {"id": "other"}])
-
-    ok = mod.ensure_field_exists(Sess1(), "https://example", mod.SOW_FIELD_ID, timeout=1, verbose=True)
+    sess = StubSession(gets=[FakeResponse.ok([{"id": mod.SOW_FIELD_ID}, {"id": "other"}])])
+    ok = mod.ensure_field_exists(sess, "https://example", mod.SOW_FIELD_ID, timeout=1, verbose=True)
     assert ok is True
 
     # False case: field missing
-    class Sess2:
-        def get(self, url, timeout=None):
-            return FakeResponse(status_code=200, json_data=[{"id": "not_it"}])
-
-    ok2 = mod.ensure_field_exists(Sess2(), "https://example", mod.SOW_FIELD_ID, timeout=1, verbose=False)
+    sess = StubSession(gets=[FakeResponse.ok([{"id": "not_it"}])])
+    ok2 = mod.ensure_field_exists(sess, "https://other", mod.SOW_FIELD_ID, timeout=1, verbose=False)
     assert ok2 is False
 
     # HTTP error case should warn and return True (continue without hard-fail)
-    class Sess3:
-        def get(self, url, timeout=None):
-            return FakeResponse(status_code=400, raise_for_status_exc=make_http_error(400))
-
-    assert mod.ensure_field_exists(Sess3(), "https://example", mod.SOW_FIELD_ID, timeout=1, verbose=False) is True
-
-
-def test_post_search_jql_paginates(monkeypatch):
+    sess = StubSession(gets=[FakeResponse.err(400)])
+    assert mod.ensure_field_exists(sess, "https://third", mod.SOW_FIELD_ID, timeout=1, verbose=False) is True
+
+
+def test_ensure_field_exists_memoizes_definitive_answers(capsys):
+    sess = StubSession(gets=[FakeResponse.err(503), FakeResponse.ok([{"id": "other"}])])
+    assert mod.ensure_field_exists(sess, "https://m", mod.SOW_FIELD_ID, timeout=1) is True  # error: not memoized
+    assert mod.ensure_field_exists(sess, "https://m", mod.SOW_FIELD_ID, timeout=1) is False
+    assert mod.ensure_field_exists(sess, "https://m", mod.SOW_FIELD_ID, timeout=1) is False
+    assert len(sess.calls) == 2
+    assert capsys.readouterr().err.count("não encontrado") == 2
+
+
+def test_ensure_field_exists_uses_disk_cache_and_etag(tmp_path, monkeypatch):
+    cache = tmp_path / "cache" / "fields.json"
+    etag = {"ETag": '"v1"'}
+    fields = [{"id": mod.SOW_FIELD_ID}, {"id": "other"}]
+    sess = StubSession(gets=[FakeResponse(200, fields, headers=etag), FakeResponse(304, headers=etag), FakeResponse(304, headers=etag)])
+
+    # First run fetches and writes the cache
+    assert mod.ensure_field_exists(sess, "https://a", mod.SOW_FIELD_ID, timeout=1, cache_path=str(cache))
+    assert [c[3] for c in sess.calls] == [None]
+    assert json.loads(cache.read_text())["https://a"]["etag"] == '"v1"'
+
+    # Fresh cache containing the field: no request at all (new process, empty in-memory memo)
+    mod._FIELD_EXISTS.clear()
+    idle = StubSession()
+    assert mod.ensure_field_exists(idle, "https://a", mod.SOW_FIELD_ID, timeout=1, cache_path=str(cache))
+    assert idle.calls == []
+
+    # Field not cached (or stale cache): revalidate; 304 reuses the cached ids
+    assert mod.ensure_field_exists(sess, "https://a", "customfield_missing", timeout=1, cache_path=str(cache)) is False
+    assert sess.calls[-1][3] == {"If-None-Match": '"v1"'}
+    monkeypatch.setattr(mod.time, "time", lambda: 10 ** 12)
+    mod._FIELD_EXISTS.clear()
+    assert mod.ensure_field_exists(sess, "https://a", mod.SOW_FIELD_ID, timeout=1, cache_path=str(cache)) is True
+    assert len(sess.calls) == 3
+
+
+def test_field_cache_helpers_tolerate_bad_files(tmp_path, monkeypatch):
+    bad = tmp_path / "fields.json"
+    bad.write_text("[1, 2]")
+    assert mod._load_field_cache(str(bad)) == {}
+    assert mod._load_field_cache(str(tmp_path / "missing.json")) == {}
+    # Parent is a file: saving silently gives up
+    mod._save_field_cache(str(bad / "fields.json"), {"x": 1})
+
+    monkeypatch.setattr(mod.os, "name", "posix")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert mod.default_field_cache_path() == os.path.join(str(tmp_path), "jira_worklog_extractor", "fields.json")
+
+
+def test_post_search_jql_paginates(monkeypatch, capsys):
     pages = [
         FakeResponse(
             status_code=200,
@@ -96,25 +136,103 @@ def test_post_search_jql_paginates(monkeypatch):
             json_data={"issues": [{"id": "2"}], "nextPageToken": None},
         ),
     ]
-    calls = {"i": 0}
-
-    class Sess:
-        def post(self, url, json=None, timeout=None):
-            r = pages[calls["i"]]
-            calls["i"] += 1
-            return r
-
-    res = mod.post_search_jql(Sess(), "https://x", "project = TEST", ["summary"], timeout=5, verbose=True)
+    sess = StubSession(posts=pages)
+    res = mod.post_search_jql(sess, "https://x", "project = TEST", ["summary"], timeout=5, verbose=True)
     assert [x["id"] for x in res] == ["1", "2"]
-    assert calls["i"] == 2
+    assert [c[2].get("nextPageToken") for c in sess.calls] == [None, "nxt"]
+    assert {c[2]["maxResults"] for c in sess.calls} == {mod.PAGE_SIZE}
+    assert capsys.readouterr().err.count("limitou a página") == 1
 
 
 def test_post_search_jql_http_error_exits(monkeypatch):
-    class Sess:
-        def post(self, url, json=None, timeout=None):
-            # raise_for_status will raise
-            return FakeResponse(status_code=400, raise_for_status_exc=make_http_error(400))
-
+    # raise_for_status will raise on every attempt
+    sess = StubSession(posts=[FakeResponse.err(400)] * 5)
     with pytest.raises(SystemExit) as ei:
-        mod.post_search_jql(Sess(), "https://x", "bad", ["f"], timeout=1, verbose=False)
+        mod.post_search_jql(sess, "https://x", "bad", ["f"], timeout=1, verbose=False)
     assert ei.value.code == 3
+
+
+def test_split_date_range_covers_range_in_whole_days():
+    start = datetime(2025, 10, 1, tzinfo=mod.DEFAULT_TZ)
+    end = datetime(2025, 10, 11, tzinfo=mod.DEFAULT_TZ)
+    windows = mod.split_date_range(start, end, 4)
+    assert windows[0][0] == start and windows[-1][1] == end
+    assert len(windows) == 4
+    assert all(a[1] == b[0] for a, b in zip(windows, windows[1:]))
+    assert [(w[1] - w[0]).days for w in windows] == [3, 3, 3, 1]
+
+
+def test_post_search_jql_parallel_dedupes_by_key(monkeypatch):
+    jqls = []
+
+    def fake_search(session, base_url, jql, fields, timeout, verbose=False):
+        jqls.append(jql)
+        return [{"key": "A-1"}, {"key": f"W-{len(jqls)}"}, {"id": "no-key"}]
+
+    monkeypatch.setattr(mod, "post_search_jql", fake_search)
+    start = datetime(2025, 10, 1, tzinfo=mod.DEFAULT_TZ)
+    end = datetime(2025, 10, 5, tzinfo=mod.DEFAULT_TZ)
+    res = mod.post_search_jql_parallel(object(), "https://x", start, end, ["summary"], timeout=1, max_workers=2)
+
+    assert sorted(jqls) == [
+        'worklogDate >= "2025-10-01" AND worklogDate <= "2025-10-02"',
+        'worklogDate >= "2025-10-03" AND worklogDate <= "2025-10-04"',
+    ]
+    keys = [i.get("key") for i in res]
+    assert keys.count("A-1") == 1
+    assert len(res) == 5
+
+
+def test_post_search_jql_parallel_single_day_is_serial(monkeypatch):
+    jqls = []
+    monkeypatch.setattr(mod, "post_search_jql", lambda s, b, jql, f, timeout, verbose=False: jqls.append(jql) or [])
+    start = datetime(2025, 10, 5, tzinfo=mod.DEFAULT_TZ)
+    end = datetime(2025, 10, 6, tzinfo=mod.DEFAULT_TZ)
+    assert mod.post_search_jql_parallel(object(), "https://x", start, end, [], timeout=1, max_workers=8) == []
+    assert jqls == ['worklogDate >= "2025-10-05" AND worklogDate <= "2025-10-05"']
+
+
+def _real_response(body: bytes) -> requests.Response:
+    r = requests.Response()
+    r.status_code = 200
+    r._content = body
+    r.encoding = "utf-8"
+    return r
+
+
+def test_response_json_decodes_raw_bytes_with_fast_loader(monkeypatch):
+    seen = []
+
+    def fake_loads(b):
+        seen.append(b)
+        return {"fast": True}
+
+    monkeypatch.setattr(mod, "_fast_loads", fake_loads)
+    assert mod._response_json(_real_response(b'{"a": 1}')) == {"fast": True}
+    assert seen == [b'{"a": 1}']
+    # Stubs without a bytes body keep using their own .json()
+    assert mod._response_json(FakeResponse(200, json_data={"stub": 1})) == {"stub": 1}
+
+
+def test_response_json_without_fast_loader_decodes_bytes(monkeypatch):
+    monkeypatch.setattr(mod, "_fast_loads", None)
+    r = _real_response('{"ação": "ok"}'.encode("utf-8"))
+    # Wrong declared charset must not matter: bytes are decoded per RFC 8259
+    r.encoding = "latin-1"
+    monkeypatch.setattr(r, "json", lambda **k: pytest.fail("Response.json() should be bypassed"))
+    assert mod._response_json(r) == {"ação": "ok"}
+
+
+@pytest.mark.parametrize("installed, expected", [
+    ({"orjson": "orjson", "msgspec": "msgspec"}, "orjson"),
+    ({"orjson": None, "msgspec": "msgspec"}, "msgspec"),
+    ({"orjson": None, "msgspec": None}, None),
+])
+def test_find_fast_loads_prefers_orjson_then_msgspec(monkeypatch, installed, expected):
+    fakes = {
+        "orjson": SimpleNamespace(loads="orjson"),
+        "msgspec": SimpleNamespace(json=SimpleNamespace(decode="msgspec")),
+    }
+    for name, present in installed.items():
+        monkeypatch.setitem(sys.modules, name, fakes[name] if present else None)
+    assert mod._find_fast_loads() == expected
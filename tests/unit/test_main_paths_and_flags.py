@@ -1,10 +1,10 @@
 from types import SimpleNamespace
 from datetime import datetime
 import pytest
-import pandas as pd
 import requests
 
 import mJiraWorkLogExtractor as mod
+from tests.conftest import FakeResponse, StubSession
 
 
 def test_compute_bounds_with_invalid_end_uses_month_end():
@@ -56,21 +56,15 @@ def test_main_insecure_disables_warnings_and_adds_extension_and_no_sow(monkeypat
         "Tempo Gasto (h)": 1.0,
         "Descrição do Trabalho": "Done",
     }
-    monkeypatch.setattr(mod, "fetch_worklogs_for_issue", lambda *a, **k: [row])
+    monkeypatch.setattr(mod, "fetch_worklogs_for_issue", lambda *a, **k: [tuple(row[c] for c in mod.COLS)])
 
     # Stub ExcelWriter and DataFrame.to_excel
     created_paths = []
 
-    class DummyWriter:
-        def __init__(self, path, engine=None):
-            created_paths.append(str(path))
-        def __enter__(self):
-            return self
-        def __exit__(self, exc_type, exc, tb):
-            return False
+    def fake_write(path, columns, rows_iter, **_k):
+        created_paths.append(str(path))
 
-    monkeypatch.setattr(pd, "ExcelWriter", DummyWriter)
-    monkeypatch.setattr(pd.DataFrame, "to_excel", lambda self, writer, index=False, sheet_name="Relatório": None)
+    monkeypatch.setattr(mod, "write_xlsx_streaming", fake_write)
 
     # Spy on urllib3.disable_warnings by replacing function
     called = {"disabled": False}
@@ -98,53 +92,24 @@ def test_main_insecure_disables_warnings_and_adds_extension_and_no_sow(monkeypat
 
 
 def test_http_get_with_retry_404_retries_then_returns_last_response(no_sleep):
-    attempts = {"n": 0}
-
-    class Sess:
-        def get(self, url, params=None, timeout=None):
-            attempts["n"] += 1
-            # Always 404; raise_for_status should be triggered in code
-            return FakeResp(404)
-
-    class FakeResp:
-        def __init__(self, code):
-            self.status_code = code
-            self.headers = {}
-        def raise_for_status(self):
-            raise requests.HTTPError("404")
-
-    s = Sess()
+    # Always 404; raise_for_status should be triggered in code
+    s = StubSession(gets=[FakeResponse.err(404)] * 2)
     r = mod.http_get_with_retry(s, "https://x", timeout=1, max_tries=2, backoff_base=0.0)
     assert r is not None
-    assert attempts["n"] == 2
+    assert len(s.calls) == 2
     assert r.status_code == 404
 
 
-def test_fetch_worklogs_invalid_started_is_skipped(monkeypatch):
+def test_fetch_worklogs_invalid_started_is_skipped():
     issue = {"key": "K-1", "fields": {"summary": "", "project": {}, "issuetype": {}, "priority": {}}}
     # One invalid started string
     wls = [{"started": "not-an-iso", "author": {"displayName": "U"}, "timeSpentSeconds": 60, "comment": ""}]
 
-    class Resp:
-        def __init__(self):
-            self.status_code = 200
-        def json(self):
-            return {"worklogs": wls, "total": 1}
-        def raise_for_status(self):
-            return None
-
-    def fake_get(_sess, url, params=None, timeout=None):
-        return Resp()
-
-    monkeypatch.setattr(mod, "http_get_with_retry", fake_get)
-
-    def session_factory():
-        class Dummy: ...
-        return Dummy()
+    sess = StubSession(gets=[FakeResponse.ok({"worklogs": wls, "total": 1})])
 
     start_utc = datetime(2025, 10, 1, 0, 0, tzinfo=mod.DEFAULT_TZ)
     end_utc = datetime(2025, 10, 25, 0, 0, tzinfo=mod.DEFAULT_TZ)
-    rows = mod.fetch_worklogs_for_issue("https://x", session_factory, issue, start_utc, end_utc, timeout=5)
+    rows = mod.fetch_worklogs_for_issue("https://x", sess, issue, start_utc, end_utc, timeout=5)
     assert rows == []
 
 
@@ -163,3 +128,34 @@ def test_adf_to_text_ignores_unknown_nodes():
     }
     txt = mod.adf_to_text(adf)
     assert "Hello" in txt
+
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        ("2025-10-10T10:00:00.000+0000", datetime(2025, 10, 10, 10, 0, tzinfo=mod.DEFAULT_TZ)),
+        ("2025-10-10T22:30:00.000-0300", datetime(2025, 10, 11, 1, 30, tzinfo=mod.DEFAULT_TZ)),
+        ("2025-10-10T10:00:00+00:00", datetime(2025, 10, 10, 10, 0, tzinfo=mod.DEFAULT_TZ)),
+        ("not-an-iso", None),
+        ("", None),
+    ],
+)
+@pytest.mark.parametrize("compact_ok", [True, False])
+def test_parse_started_offsets_and_invalid(monkeypatch, raw, expected, compact_ok):
+    # Both paths: parser reads '+HHMM' natively, or needs the '+HH:MM' rewrite
+    if compact_ok and not mod._accepts_compact_offset(mod._parse_iso):
+        pytest.skip("parser on this Python needs the colon rewrite")
+    monkeypatch.setattr(mod, "_ISO_COMPACT_OFFSET_OK", compact_ok)
+    mod._parse_started.cache_clear()
+    assert mod._parse_started(raw) == expected
+    mod._parse_started.cache_clear()
+
+
+def test_accepts_compact_offset_probe():
+    def strict(s):
+        if s.endswith("+0000"):
+            raise ValueError(s)
+        return datetime.fromisoformat(s)
+
+    assert mod._accepts_compact_offset(strict) is False
+    assert mod._accepts_compact_offset(lambda s: datetime(2000, 1, 1)) is True
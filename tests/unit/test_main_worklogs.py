@@ -1,11 +1,12 @@
+import sys
 from types import SimpleNamespace
 from datetime import datetime, timezone
 import builtins
 
 import pytest
-import pandas as pd
 
 import mJiraWorkLogExtractor as mod
+from tests.conftest import FakeResponse, StubSession, StubXlsxWriter
 
 
 def test_fetch_worklogs_for_issue_filters_and_maps(monkeypatch):
@@ -46,22 +47,14 @@ def test_fetch_worklogs_for_issue_filters_and_maps(monkeypatch):
         },
     ]
 
-    class Sess:
-        def get(self, url, params=None, timeout=None):
-            # Single page containing all worklogs
-            return SimpleResponse(
-                status_code=200,
-                json_data={"worklogs": worklogs, "total": len(worklogs)},
-            )
-
-    def session_factory():
-        return Sess()
+    # Single page containing all worklogs
+    sess = StubSession(gets=[FakeResponse.ok({"worklogs": worklogs, "total": len(worklogs)})])
 
     # Date bounds: inclusive start 10-01, exclusive end 10-25
     start_utc = datetime(2025, 10, 1, 0, 0, tzinfo=mod.DEFAULT_TZ)
     end_utc = datetime(2025, 10, 25, 0, 0, tzinfo=mod.DEFAULT_TZ)
 
-    rows = mod.fetch_worklogs_for_issue(base_url, session_factory, issue, start_utc, end_utc, timeout=5)
+    rows = [dict(zip(mod.COLS, r)) for r in mod.fetch_worklogs_for_issue(base_url, sess, issue, start_utc, end_utc, timeout=5)]
     # Expect 2 rows (the first and third entries)
     assert len(rows) == 2
 
@@ -84,21 +77,6 @@ def test_fetch_worklogs_for_issue_filters_and_maps(monkeypatch):
     assert r2["Descrição do Trabalho"] == "Note"
 
 
-class SimpleResponse:
-    def __init__(self, status_code=200, json_data=None, text="", headers=None):
-        self.status_code = status_code
-        self._json = json_data
-        self.text = text
-        self.headers = headers or {}
-
-    def json(self):
-        return self._json
-
-    def raise_for_status(self):
-        if 400 <= self.status_code:
-            raise Exception(f"HTTP {self.status_code}")
-
-
 def test_main_smoke_writes_full_and_short_with_suffix(monkeypatch, tmp_path, capsys, tmp_config_file):
     out_file = tmp_path / "report.xlsx"
 
@@ -133,21 +111,11 @@ def test_main_smoke_writes_full_and_short_with_suffix(monkeypatch, tmp_path, cap
         "Tempo Gasto (h)": 1.0,
         "Descrição do Trabalho": "Done",
     }
-    monkeypatch.setattr(mod, "fetch_worklogs_for_issue", lambda *a, **k: [row])
-
-    # Stub out Excel writing so we don't require openpyxl and no real files needed
-    created_paths = []
+    monkeypatch.setattr(mod, "fetch_worklogs_for_issue", lambda *a, **k: [tuple(row[c] for c in mod.COLS)])
 
-    class DummyWriter:
-        def __init__(self, path, engine=None):
-            created_paths.append(str(path))
-        def __enter__(self):
-            return self
-        def __exit__(self, exc_type, exc, tb):
-            return False
-
-    monkeypatch.setattr(pd, "ExcelWriter", DummyWriter)
-    monkeypatch.setattr(pd.DataFrame, "to_excel", lambda self, writer, index=False, sheet_name="Relatório": None)
+    # Stub out Excel writing so no real files are needed
+    writer = StubXlsxWriter()
+    monkeypatch.setattr(mod, "write_xlsx_streaming", writer)
 
     # Run main
     mod.main()
@@ -159,9 +127,249 @@ def test_main_smoke_writes_full_and_short_with_suffix(monkeypatch, tmp_path, cap
         full += ".xlsx"
     short = full[:-5] + "_short.xlsx"
 
-    # created_paths should contain both
-    assert full in created_paths
-    assert short in created_paths
+    # both files were written, the short one with SHORT_COLS
+    assert writer.files[full][0] == list(mod.COLS)
+    assert writer.files[short][0] == list(mod.SHORT_COLS)
 
     # Check printed suffix info
     assert "_short.xlsx" in stdout
+
+
+def test_main_shares_one_session_across_issues(monkeypatch, tmp_path, tmp_config_file):
+    monkeypatch.setattr(
+        mod,
+        "parse_args",
+        lambda: SimpleNamespace(
+            config=str(tmp_config_file),
+            out=str(tmp_path / "report.xlsx"),
+            verbose=False,
+            max_workers=2,
+            timeout=5,
+            insecure=False,
+        ),
+    )
+    monkeypatch.setattr(mod, "ensure_field_exists", lambda *a, **k: True)
+    monkeypatch.setattr(mod, "post_search_jql", lambda *a, **k: [{"key": f"T-{i}", "fields": {}} for i in range(3)])
+    monkeypatch.setattr(mod, "write_xlsx_streaming", lambda *a, **k: None)
+
+    sessions = []
+
+    def fake_fetch(base_url, session, issue, start_utc, end_utc, timeout, cancel_event=None):
+        sessions.append(session)
+        return []
+
+    monkeypatch.setattr(mod, "fetch_worklogs_for_issue", fake_fetch)
+
+    mod.main()
+
+    assert len(sessions) == 3
+    assert len({id(s) for s in sessions}) == 1
+
+
+def test_main_ctrl_c_cancels_pending_issues_and_exits_130(monkeypatch, base_parsed_args, capsys):
+    monkeypatch.setattr(mod, "parse_args", lambda: base_parsed_args)
+    monkeypatch.setattr(mod, "ensure_field_exists", lambda *a, **k: True)
+    monkeypatch.setattr(mod, "post_search_jql", lambda *a, **k: [{"key": f"T-{i}", "fields": {}} for i in range(4)])
+    monkeypatch.setattr(mod, "write_xlsx_streaming", lambda *a, **k: pytest.fail("no report after Ctrl+C"))
+    started, events = [], []
+
+    def fake_fetch(base_url, session, issue, start_utc, end_utc, timeout, cancel_event=None):
+        started.append(issue["key"])
+        events.append(cancel_event)
+        if issue["key"] == "T-0":
+            raise KeyboardInterrupt
+        cancel_event.wait(5)  # a worker that already took the next issue is released by the event
+        return []
+
+    monkeypatch.setattr(mod, "fetch_worklogs_for_issue", fake_fetch)
+
+    with pytest.raises(SystemExit) as ei:
+        mod.main()
+
+    assert ei.value.code == 130
+    assert started[0] == "T-0" and set(started) <= {"T-0", "T-1"}  # queued issues were cancelled
+    assert all(e.is_set() for e in events)
+    assert "interrompido" in capsys.readouterr().err
+
+
+def _bulk_issue(issue_id, key):
+    return {"id": issue_id, "key": key, "fields": {"summary": "S", "project": {"name": "P"}}}
+
+
+def test_fetch_worklogs_bulk_joins_by_issue_id_and_follows_next_page(no_sleep):
+    base_url = "https://example.atlassian.net"
+    start_utc = datetime(2025, 10, 1, tzinfo=mod.DEFAULT_TZ)
+    end_utc = datetime(2025, 10, 25, tzinfo=mod.DEFAULT_TZ)
+    next_url = base_url + "/rest/api/3/worklog/updated?since=1&page=2"
+    end_ms = int(end_utc.timestamp() * 1000)
+
+    page1 = FakeResponse.ok({"values": [{"worklogId": 1}, {"worklogId": 2}], "lastPage": False, "nextPage": next_url})
+    # Id 4 was logged after the range ended: still listed, its 'started' decides
+    page2 = FakeResponse.ok({
+        "values": [{"worklogId": 3, "updatedTime": end_ms - 1}, {"worklogId": 4, "updatedTime": end_ms + 86_400_000}],
+        "lastPage": True,
+    })
+    hydrated = FakeResponse.ok([
+        {"issueId": "10", "started": "2025-10-10T10:00:00.000+0000", "author": {"displayName": "A"},
+         "timeSpentSeconds": 3600, "comment": "c1"},
+        {"issueId": "10", "started": "2025-10-24T18:00:00.000+0000", "author": {"displayName": "B"},
+         "timeSpentSeconds": 1800, "comment": "late"},
+        {"issueId": "10", "started": "2025-09-10T10:00:00.000+0000", "timeSpentSeconds": 60},
+        {"issueId": "99", "started": "2025-10-10T10:00:00.000+0000", "timeSpentSeconds": 60},
+    ])
+    s = StubSession(gets=[page1, page2], posts=[hydrated])
+    issues = [_bulk_issue("10", "T-1"), _bulk_issue("11", "T-2")]
+    rows, pending = mod.fetch_worklogs_bulk(base_url, s, issues, start_utc, end_utc, timeout=5)
+
+    gets = [c for c in s.calls if c[0] == "GET"]
+    assert gets[0][2] == {"since": int(start_utc.timestamp() * 1000)}
+    assert gets[1][1:3] == (next_url, None)
+    assert len(gets) == 2
+    assert [c[2]["ids"] for c in s.calls if c[0] == "POST"] == [[1, 2, 3, 4]]
+    assert [(r[2], r[7], r[8], r[9]) for r in rows] == [("T-1", "A", 1.0, "c1"), ("T-1", "B", 0.5, "late")]
+    assert [i["key"] for i in pending] == ["T-2"]
+
+
+def test_fetch_worklogs_bulk_falls_back_on_errors(no_sleep, capsys):
+    start_utc = datetime(2025, 10, 1, tzinfo=mod.DEFAULT_TZ)
+    end_utc = datetime(2025, 10, 25, tzinfo=mod.DEFAULT_TZ)
+    issues = [_bulk_issue("10", "T-1")]
+
+    def down():
+        return StubSession(gets=[FakeResponse(500)] * 5)  # every retry of worklog/updated fails
+
+    rows, pending = mod.fetch_worklogs_bulk("https://x", down(), issues, start_utc, end_utc, timeout=5)
+    assert rows == [] and pending == issues
+    assert "worklog/updated" in capsys.readouterr().err
+
+    list_fails = StubSession(gets=[FakeResponse.ok({"values": [{"worklogId": 1}], "lastPage": True})], posts=[FakeResponse(500)] * 5)
+    rows, pending = mod.fetch_worklogs_bulk("https://x", list_fails, issues, start_utc, end_utc, timeout=5)
+    assert rows == [] and pending == issues
+    assert "worklog/list" in capsys.readouterr().err
+
+    # Issues without ids cannot be joined: everything goes to the per-issue path
+    keyless = [{"key": "T-9", "fields": {}}]
+    assert mod.fetch_worklogs_bulk("https://x", down(), keyless, start_utc, end_utc, timeout=5) == ([], keyless)
+
+
+def test_fetch_worklogs_bulk_failed_second_batch_refetches_every_issue(no_sleep, capsys):
+    start_utc = datetime(2025, 10, 1, tzinfo=mod.DEFAULT_TZ)
+    end_utc = datetime(2025, 10, 25, tzinfo=mod.DEFAULT_TZ)
+    issues = [_bulk_issue("10", "T-1"), _bulk_issue("11", "T-2")]
+    # 1001 ids -> two worklog/list batches; T-1 gets a row from the first, the second fails
+    feed = FakeResponse.ok({"values": [{"worklogId": i} for i in range(1001)], "lastPage": True})
+    first = FakeResponse.ok([{"issueId": "10", "started": "2025-10-10T10:00:00.000+0000", "timeSpentSeconds": 60}])
+    s = StubSession(gets=[feed], posts=[first] + [FakeResponse(500)] * 5)
+
+    rows, pending = mod.fetch_worklogs_bulk("https://x", s, issues, start_utc, end_utc, timeout=5)
+
+    assert rows == [] and pending == issues
+    assert [len(c[2]["ids"]) for c in s.calls if c[0] == "POST"][:2] == [1000, 1]
+    assert "worklog/list" in capsys.readouterr().err
+
+
+def test_main_bulk_worklogs_only_fetches_unmatched_issues(monkeypatch, tmp_path, tmp_config_file):
+    monkeypatch.setattr(
+        mod,
+        "parse_args",
+        lambda: SimpleNamespace(
+            config=str(tmp_config_file), out=str(tmp_path / "report.xlsx"), verbose=False,
+            max_workers=2, timeout=5, insecure=False, bulk_worklogs=True,
+        ),
+    )
+    monkeypatch.setattr(mod, "ensure_field_exists", lambda *a, **k: True)
+    issues = [_bulk_issue("10", "T-1"), _bulk_issue("11", "T-2")]
+    monkeypatch.setattr(mod, "post_search_jql", lambda *a, **k: issues)
+    bulk_row = ("P", "", "T-1", "S", "", "", "2025-10-10", "A", 1.0, "")
+    monkeypatch.setattr(mod, "fetch_worklogs_bulk", lambda *a, **k: ([bulk_row], [issues[1]]))
+
+    fetched = []
+
+    def fake_fetch(base_url, session, issue, start_utc, end_utc, timeout, cancel_event=None):
+        fetched.append(issue["key"])
+        return [("P", "", issue["key"], "S", "", "", "2025-10-11", "B", 2.0, "")]
+
+    monkeypatch.setattr(mod, "fetch_worklogs_for_issue", fake_fetch)
+    writer = StubXlsxWriter()
+    monkeypatch.setattr(mod, "write_xlsx_streaming", writer)
+
+    mod.main()
+
+    assert fetched == ["T-2"]
+    full = writer.files[str(tmp_path / "report.xlsx")][1]
+    assert sorted(r[2] for r in full) == ["T-1", "T-2"]
+
+
+def test_append_worklog_rows_window_bounds_across_offsets():
+    start_utc = datetime(2025, 10, 1, tzinfo=mod.DEFAULT_TZ)
+    end_utc = datetime(2025, 10, 25, tzinfo=mod.DEFAULT_TZ)
+    wlogs = [
+        {"started": "2025-10-01T00:00:00.000+0000", "timeSpentSeconds": 60},  # inclusive start
+        {"started": "2025-10-25T00:00:00.000+0000", "timeSpentSeconds": 60},  # exclusive end
+        {"started": "2025-10-01T01:00:00.000+0300", "timeSpentSeconds": 60},  # 2025-09-30T22:00Z
+        {"started": "2025-10-24T22:00:00.000-0300", "timeSpentSeconds": 60},  # 2025-10-25T01:00Z
+        {"started": "2025-10-24T20:00:00.000-0300", "timeSpentSeconds": 60},  # 2025-10-24T23:00Z
+    ]
+    out = []
+    mod._append_worklog_rows(out, ("P", "T", "K-1", "S", "M", ""), wlogs, start_utc, end_utc)
+    assert [r[6] for r in out] == ["2025-10-01", "2025-10-24"]
+
+
+def test_append_worklog_rows_skips_distant_history_without_parsing(monkeypatch):
+    start_utc = datetime(2025, 10, 1, tzinfo=mod.DEFAULT_TZ)
+    end_utc = datetime(2025, 10, 25, tzinfo=mod.DEFAULT_TZ)
+    parsed = []
+    real = mod._parse_started
+    monkeypatch.setattr(mod, "_parse_started", lambda raw: parsed.append(raw) or real(raw))
+    wlogs = [
+        {"started": "2024-03-05T10:00:00.000+0000", "timeSpentSeconds": 60},  # old history
+        {"started": "2025-09-30T20:00:00.000-1000", "timeSpentSeconds": 60},  # 2025-10-01T06:00Z, local day before
+        {"started": "2025-10-25T09:00:00.000+1400", "timeSpentSeconds": 60},  # 2025-10-24T19:00Z, local day after
+        {"started": "2026-01-02T10:00:00.000+0000", "timeSpentSeconds": 60},  # future
+        {"started": None, "timeSpentSeconds": 60},
+        {"started": "2025-10", "timeSpentSeconds": 60},  # no calendar day to report
+    ]
+    out = []
+    mod._append_worklog_rows(out, ("P", "T", "K-1", "S", "M", ""), wlogs, start_utc, end_utc)
+    assert [r[6] for r in out] == ["2025-09-30", "2025-10-25"]
+    assert parsed == [wlogs[1]["started"], wlogs[2]["started"]]
+
+
+def test_main_reports_progress_in_batches(monkeypatch, tmp_path, tmp_config_file):
+    monkeypatch.setattr(mod, "parse_args", lambda: SimpleNamespace(
+        config=str(tmp_config_file), out=str(tmp_path / "r.xlsx"), verbose=False,
+        max_workers=4, timeout=5, insecure=False,
+    ))
+    monkeypatch.setattr(mod, "ensure_field_exists", lambda *a, **k: True)
+    monkeypatch.setattr(mod, "post_search_jql", lambda *a, **k: [{"key": f"T-{i}", "fields": {}} for i in range(40)])
+    monkeypatch.setattr(mod, "fetch_worklogs_for_issue", lambda *a, **k: [])
+    monkeypatch.setattr(mod, "write_xlsx_streaming", lambda *a, **k: None)
+
+    updates = []
+
+    class Bar:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def update(self, n):
+            updates.append(n)
+
+    monkeypatch.setattr(mod, "_progress_bar", lambda total: Bar())
+    mod.main()
+    assert updates == [16, 16, 8]
+
+
+def test_progress_bar_is_throttled_and_hidden_off_tty(monkeypatch):
+    import io
+
+    monkeypatch.setattr(sys, "stderr", io.StringIO())
+    with mod._progress_bar(1000) as bar:
+        assert bar.disable is True
+
+    seen = {}
+    monkeypatch.setattr(mod, "tqdm", lambda **kw: seen.update(kw))
+    mod._progress_bar(1000)
+    assert seen["miniters"] == 5 and seen["mininterval"] == 0.5 and seen["disable"] is None
@@ -1,6 +1,5 @@
 from types import SimpleNamespace
 
-import pandas as pd
 import mJiraWorkLogExtractor as mod
 
 
@@ -31,15 +30,9 @@ def test_max_workers_from_config(monkeypatch, tmp_path):
 
     # Avoid real HTTP and Excel writing
     monkeypatch.setattr(mod, "ensure_field_exists", lambda *a, **k: True)
-    monkeypatch.setattr(mod, "post_search_jql", lambda *a, **k: [])
+    monkeypatch.setattr(mod, "post_search_jql_parallel", lambda *a, **k: [])
 
-    class DummyWriter:
-        def __init__(self, path, engine=None): ...
-        def __enter__(self): return self
-        def __exit__(self, exc_type, exc, tb): return False
-
-    monkeypatch.setattr(pd, "ExcelWriter", DummyWriter)
-    monkeypatch.setattr(pd.DataFrame, "to_excel", lambda *a, **k: None)
+    monkeypatch.setattr(mod, "write_xlsx_streaming", lambda *a, **k: None)
 
     # Capture the max_workers used to instantiate the executor
     captured = {"mw": None}
@@ -82,15 +75,9 @@ def test_max_workers_cli_overrides_config(monkeypatch, tmp_path):
     )
     monkeypatch.setattr(mod, "parse_args", lambda: parsed)
     monkeypatch.setattr(mod, "ensure_field_exists", lambda *a, **k: True)
-    monkeypatch.setattr(mod, "post_search_jql", lambda *a, **k: [])
-
-    class DummyWriter:
-        def __init__(self, path, engine=None): ...
-        def __enter__(self): return self
-        def __exit__(self, exc_type, exc, tb): return False
+    monkeypatch.setattr(mod, "post_search_jql_parallel", lambda *a, **k: [])
 
-    monkeypatch.setattr(pd, "ExcelWriter", DummyWriter)
-    monkeypatch.setattr(pd.DataFrame, "to_excel", lambda *a, **k: None)
+    monkeypatch.setattr(mod, "write_xlsx_streaming", lambda *a, **k: None)
 
     captured = {"mw": None}
 
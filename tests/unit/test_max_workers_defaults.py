@@ -1,19 +1,13 @@
 from types import SimpleNamespace
 
-import pandas as pd
 import mJiraWorkLogExtractor as mod
 
 
 def _patch_io_and_http(monkeypatch):
     # Avoid real HTTP and Excel writing
     monkeypatch.setattr(mod, "ensure_field_exists", lambda *a, **k: True)
-    monkeypatch.setattr(mod, "post_search_jql", lambda *a, **k: [])
-    class DummyWriter:
-        def __init__(self, path, engine=None): ...
-        def __enter__(self): return self
-        def __exit__(self, exc_type, exc, tb): return False
-    monkeypatch.setattr(pd, "ExcelWriter", DummyWriter)
-    monkeypatch.setattr(pd.DataFrame, "to_excel", lambda *a, **k: None)
+    monkeypatch.setattr(mod, "post_search_jql_parallel", lambda *a, **k: [])
+    monkeypatch.setattr(mod, "write_xlsx_streaming", lambda *a, **k: None)
 
 
 def test_max_workers_invalid_in_config_uses_default(monkeypatch, tmp_path):
@@ -1,48 +1,30 @@
 from datetime import datetime
 
 import mJiraWorkLogExtractor as mod
+from tests.conftest import FakeResponse, StubSession
 
 
 def test_fetch_worklogs_http_get_none_breaks(monkeypatch):
     # If http_get_with_retry returns None, loop should break and return []
     monkeypatch.setattr(mod, "http_get_with_retry", lambda *_a, **_k: None)
 
-    def session_factory():
-        class Dummy: ...
-        return Dummy()
-
     issue = {"key": "K-4", "fields": {}}
     start_utc = datetime(2025, 10, 1, 0, 0, tzinfo=mod.DEFAULT_TZ)
     end_utc = datetime(2025, 10, 25, 0, 0, tzinfo=mod.DEFAULT_TZ)
-    rows = mod.fetch_worklogs_for_issue("https://x", session_factory, issue, start_utc, end_utc, timeout=5)
+    rows = mod.fetch_worklogs_for_issue("https://x", object(), issue, start_utc, end_utc, timeout=5)
     assert rows == []
 
 
 def test_post_search_jql_next_token_no_issues(monkeypatch):
     # Ensure that a page with a nextPageToken but empty issues still terminates
-    pages = [
-        type("R", (), {
-            "status_code": 200,
-            "raise_for_status": staticmethod(lambda: None),
-            "json": staticmethod(lambda: {"issues": [], "nextPageToken": "nxt"}),
-        })(),
-        type("R", (), {
-            "status_code": 200,
-            "raise_for_status": staticmethod(lambda: None),
-            "json": staticmethod(lambda: {"issues": [], "nextPageToken": None}),
-        })(),
-    ]
-    calls = {"i": 0}
-
-    class Sess:
-        def post(self, url, json=None, timeout=None):
-            r = pages[calls["i"]]
-            calls["i"] += 1
-            return r
-
-    res = mod.post_search_jql(Sess(), "https://x", "project = TEST", ["summary"], timeout=5, verbose=False)
+    sess = StubSession(posts=[
+        FakeResponse.ok({"issues": [], "nextPageToken": "nxt"}),
+        FakeResponse.ok({"issues": [], "nextPageToken": None}),
+    ])
+
+    res = mod.post_search_jql(sess, "https://x", "project = TEST", ["summary"], timeout=5, verbose=False)
     assert res == []
-    assert calls["i"] == 1
+    assert len(sess.calls) == 1
 
 
 def test_make_session_no_proxies_verify_true():
@@ -56,3 +38,15 @@ def test_jql_for_range_single_day():
     end = datetime(2025, 10, 6, 0, 0, tzinfo=mod.DEFAULT_TZ)  # exclusive
     jql = mod.jql_for_range(start, end)
     assert jql == 'worklogDate >= "2025-10-05" AND worklogDate <= "2025-10-05"'
+
+
+def test_make_session_mounts_pool_sized_to_workers():
+    s = mod.make_session("u", "t", max_workers=6)
+    adapter = s.get_adapter("https://example.atlassian.net")
+    assert adapter._pool_connections == 6
+    assert adapter._pool_maxsize == mod.POOL_MAXSIZE_FLOOR  # 2 * 6 < floor
+    assert mod.make_session("u", "t", max_workers=16).get_adapter("https://x")._pool_maxsize == 32
+    retry = adapter.max_retries
+    assert retry.connect == mod.CONNECT_RETRIES
+    assert (retry.read, retry.status, retry.other, retry.redirect) == (0, 0, 0, 0)
+    assert s.get_adapter("http://example") is adapter
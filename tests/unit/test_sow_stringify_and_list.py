@@ -6,9 +6,10 @@ from datetime import datetime
 import pytest
 
 import mJiraWorkLogExtractor as mod
+from tests.conftest import FakeResponse, StubSession
 
 
-def test_fetch_worklogs_sow_list_and_hierarchy(monkeypatch):
+def test_fetch_worklogs_sow_list_and_hierarchy():
     # SoW as mixed list -> stringify produces "SOW 12 | Top:Leaf"
     # fetch_worklogs_for_issue should then keep only numeric parts -> "12"
     issue = {
@@ -29,52 +30,23 @@ def test_fetch_worklogs_sow_list_and_hierarchy(monkeypatch):
         "comment": "C",
     }
 
-    class Resp:
-        def __init__(self):
-            self.status_code = 200
-        def json(self):
-            return {"worklogs": [wl], "total": 1}
-        def raise_for_status(self): pass
-
-    def fake_get(_sess, url, params=None, timeout=None):
-        return Resp()
-
-    monkeypatch.setattr(mod, "http_get_with_retry", fake_get)
-
-    def session_factory():
-        class Dummy: ...
-        return Dummy()
+    sess = StubSession(gets=[FakeResponse.ok({"worklogs": [wl], "total": 1})])
 
     start_utc = datetime(2025, 10, 1, 0, 0, tzinfo=mod.DEFAULT_TZ)
     end_utc = datetime(2025, 10, 25, 0, 0, tzinfo=mod.DEFAULT_TZ)
-    rows = mod.fetch_worklogs_for_issue("https://x", session_factory, issue, start_utc, end_utc, timeout=5)
+    rows = [dict(zip(mod.COLS, r)) for r in mod.fetch_worklogs_for_issue("https://x", sess, issue, start_utc, end_utc, timeout=5)]
     assert len(rows) == 1
     assert rows[0]["SoW"] == "12"  # only numeric part retained
 
 
 def test_post_search_jql_no_issues(monkeypatch):
-    class Sess:
-        def post(self, url, json=None, timeout=None):
-            class R:
-                def __init__(self):
-                    self.status_code = 200
-                def raise_for_status(self): pass
-                def json(self):
-                    return {"issues": [], "nextPageToken": None}
-            return R()
-    res = mod.post_search_jql(Sess(), "https://x", "project = TEST", ["summary"], timeout=5, verbose=False)
+    sess = StubSession(posts=[FakeResponse.ok({"issues": [], "nextPageToken": None})])
+    res = mod.post_search_jql(sess, "https://x", "project = TEST", ["summary"], timeout=5, verbose=False)
     assert res == []
 
 
 def test_http_get_with_retry_immediate_success():
-    class Sess:
-        def get(self, url, params=None, timeout=None):
-            class R:
-                status_code = 200
-                headers = {}
-                def raise_for_status(self): pass
-            return R()
-    r = mod.http_get_with_retry(Sess(), "https://x", timeout=1, max_tries=3)
+    r = mod.http_get_with_retry(StubSession(gets=[FakeResponse.ok()]), "https://x", timeout=1, max_tries=3)
     assert r is not None and r.status_code == 200
 
 
@@ -130,3 +102,82 @@ def test_vprint_with_sep_and_end(capsys):
 
 def test_stringify_sow_on_non_string():
     assert mod.stringify_sow(123) == "123"
+
+
+@pytest.mark.parametrize(
+    "sow_str,expected",
+    [
+        ("SOW 12 | Top:Leaf", "12"),
+        ("A1 | B22 | none", "1 | 22"),
+        ("Contract 4711", "4711"),
+        ("", ""),
+    ],
+)
+def test_sow_numeric_extraction(sow_str, expected):
+    assert mod._sow_numeric(sow_str) == expected
+
+
+@pytest.mark.parametrize("first_is_adf", [True, False])
+def test_fetch_worklogs_mixed_comment_shapes(first_is_adf):
+    adf = {"type": "doc", "content": [{"type": "paragraph", "content": [{"type": "text", "text": "Rich"}]}]}
+    base = {"started": "2025-10-10T10:00:00.000+0000", "author": {"displayName": "Dev"}, "timeSpentSeconds": 60}
+    comments = [adf, "Plain", None] if first_is_adf else ["Plain", adf, None]
+    wls = [dict(base, comment=c) for c in comments]
+
+    sess = StubSession(gets=[FakeResponse.ok({"worklogs": wls, "total": len(wls)})])
+    start_utc = datetime(2025, 10, 1, 0, 0, tzinfo=mod.DEFAULT_TZ)
+    end_utc = datetime(2025, 10, 25, 0, 0, tzinfo=mod.DEFAULT_TZ)
+    rows = [dict(zip(mod.COLS, r)) for r in mod.fetch_worklogs_for_issue("https://x", sess, {"key": "K-9", "fields": {}}, start_utc, end_utc, timeout=5)]
+    descs = [r["Descrição do Trabalho"] for r in rows]
+    expected = ["Rich", "Plain", ""] if first_is_adf else ["Plain", "Rich", ""]
+    assert descs == expected
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (None, ""),
+        ("SOW 42", "42"),
+        ({"value": "Contrato 7", "child": {"value": "SoW 123"}}, "7"),
+        ([{"value": "SoW 1"}, {"name": "SoW 2"}], "1 | 2"),
+        (12.5, "12"),
+        ({"self": "https://x/option/10001", "value": "SoW 5", "id": "10001"}, "5"),  # flat option dict
+        ({"value": " ", "id": 10001, "child": None}, "10001"),
+        ({"value": "SoW 6", "children": []}, "6"),
+        ({"value": "SoW 9", "child": {"value": "x"}, "bad": {1, 2}}, "9"),  # not JSON-serializable: computed uncached
+    ],
+)
+def test_sow_value_matches_stringify_pipeline(raw, expected):
+    assert mod._sow_value(raw) == expected
+    assert mod._sow_value(raw) == mod._sow_numeric(mod.stringify_sow(raw))
+
+
+def test_sow_value_walks_each_distinct_structure_once(monkeypatch):
+    mod._sow_from_json.cache_clear()
+    calls = []
+    real = mod.stringify_sow
+    monkeypatch.setattr(mod, "stringify_sow", lambda v: calls.append(1) or real(v))
+    for _ in range(3):
+        # Fresh, key-reordered copies, as every decoded issue carries its own
+        assert mod._sow_value({"value": "SoW 77", "child": {"value": "A"}}) == "77"
+        assert mod._sow_value({"child": {"value": "A"}, "value": "SoW 77"}) == "77"
+        assert mod._sow_value({"value": "SoW 78", "id": "1"}) == "78"  # flat option: never walked
+    assert len(calls) == 1
+
+
+def test_fetch_worklogs_computes_sow_once_per_issue_across_pages(monkeypatch):
+    issue = {"key": "K-5", "fields": {mod.SOW_FIELD_ID: [{"value": "SoW 31", "child": {"value": "A"}}, "SoW 4"]}}
+    wl = {"started": "2025-10-10T10:00:00.000+0000", "author": {"displayName": "Dev"}, "timeSpentSeconds": 60}
+    pages = {0: {"worklogs": [wl] * 3, "total": 5}, 3: {"worklogs": [wl] * 2, "total": 5}}
+    monkeypatch.setattr(mod, "http_get_with_retry",
+                        lambda _s, url, params=None, timeout=None, **_kw: FakeResponse.ok(pages[params["startAt"]]))
+    calls = []
+    real = mod._sow_value
+    monkeypatch.setattr(mod, "_sow_value", lambda raw: calls.append(raw) or real(raw))
+
+    start_utc = datetime(2025, 10, 1, tzinfo=mod.DEFAULT_TZ)
+    end_utc = datetime(2025, 10, 25, tzinfo=mod.DEFAULT_TZ)
+    rows = mod.fetch_worklogs_for_issue("https://x", object(), issue, start_utc, end_utc, timeout=5)
+
+    assert [r[5] for r in rows] == ["31 | 4"] * 5
+    assert len(calls) == 1
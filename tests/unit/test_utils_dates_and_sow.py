@@ -1,24 +1,43 @@
+import io
 import re
+import sys
 from datetime import datetime, timedelta, timezone
 
 import pytest
 
 import mJiraWorkLogExtractor as mod
 
+_TZ = mod.DEFAULT_TZ
 
-def test_month_bounds_first_and_next_month():
-    # Use a fixed date
-    dt = datetime(2025, 10, 24, 15, 30, tzinfo=mod.DEFAULT_TZ)
-    start, end = mod.month_bounds(dt)
-    assert start == datetime(2025, 10, 1, 0, 0, 0, tzinfo=mod.DEFAULT_TZ)
-    assert end == datetime(2025, 11, 1, 0, 0, 0, tzinfo=mod.DEFAULT_TZ)
+# Midnight (DEFAULT_TZ) instants the date tests compare against, built once at import.
+_DT = {
+    k: datetime(*map(int, k.split("-")), tzinfo=_TZ)
+    for k in ("2025-01-01", "2025-10-01", "2025-10-10", "2025-10-11", "2025-10-24", "2025-10-25", "2025-10-26", "2025-11-01")
+}
+
+# mJiraWorkLogExtractor-YYYY-MM-DD-HHMM.xlsx
+_OUT_NAME_RE = re.compile(r"^mJiraWorkLogExtractor-\d{4}-\d{2}-\d{2}-\d{4}\.xlsx$")
+# "Hello" followed by both list items, prefixed with "- ", in document order
+_ADF_EXPECT = re.compile(r"Hello.*- Item1.*- Item2", re.S)
+
+
+@pytest.fixture(scope="module")
+def fixed_now():
+    """The 'current' instant shared by the date tests: 2025-10-24 10:00 UTC."""
+    return _DT["2025-10-24"].replace(hour=10)
+
+
+def test_month_bounds_first_and_next_month(fixed_now):
+    start, end = mod.month_bounds(fixed_now)
+    assert start == _DT["2025-10-01"]
+    assert end == _DT["2025-11-01"]
 
 
 @pytest.mark.parametrize(
     "s,expected",
     [
-        ("2025-10-24", datetime(2025, 10, 24, 0, 0, 0, tzinfo=mod.DEFAULT_TZ)),
-        (" 2025-01-01 ", datetime(2025, 1, 1, 0, 0, 0, tzinfo=mod.DEFAULT_TZ)),
+        ("2025-10-24", _DT["2025-10-24"]),
+        (" 2025-01-01 ", _DT["2025-01-01"]),
         ("", None),
         ("invalid", None),
     ],
@@ -27,113 +46,155 @@ def test_parse_config_date(s, expected):
     assert mod.parse_config_date(s) == expected
 
 
-def test_compute_bounds_defaults_end_today_when_missing():
-    now = datetime(2025, 10, 24, 10, 0, 0, tzinfo=mod.DEFAULT_TZ)
+def test_compute_bounds_defaults_end_today_when_missing(fixed_now):
     # no end_str -> should default to "today inclusive" (exclusive bound = tomorrow 00:00)
-    start, end = mod.compute_bounds(now, start_str="", end_str="")
+    start, end = mod.compute_bounds(fixed_now, start_str="", end_str="")
     # start defaults to first day of month
-    assert start == datetime(2025, 10, 1, 0, 0, 0, tzinfo=mod.DEFAULT_TZ)
+    assert start == _DT["2025-10-01"]
     # end is tomorrow at 00:00 UTC
-    assert end == datetime(2025, 10, 25, 0, 0, 0, tzinfo=mod.DEFAULT_TZ)
+    assert end == _DT["2025-10-25"]
 
 
-def test_compute_bounds_with_explicit_dates_and_safety_rule():
-    now = datetime(2025, 10, 24, 10, 0, 0, tzinfo=mod.DEFAULT_TZ)
-    # Explicit end before start -> safety kicks in (end = start + 1 day)
-    start, end = mod.compute_bounds(now, start_str="2025-10-10", end_str="2025-10-09")
-    assert start == datetime(2025, 10, 10, 0, 0, 0, tzinfo=mod.DEFAULT_TZ)
-    assert end == datetime(2025, 10, 11, 0, 0, 0, tzinfo=mod.DEFAULT_TZ)
+@pytest.mark.parametrize(
+    "start_str,end_str,exp_start,exp_end",
+    [
+        # Explicit end before start -> safety kicks in (end = start + 1 day)
+        ("2025-10-10", "2025-10-09", _DT["2025-10-10"], _DT["2025-10-11"]),
+        # Normal explicit range; end exclusive = 2025-10-25 00:00
+        ("2025-10-10", "2025-10-24", _DT["2025-10-10"], _DT["2025-10-25"]),
+    ],
+    ids=["safety_rule", "normal_range"],
+)
+def test_compute_bounds_explicit(fixed_now, start_str, end_str, exp_start, exp_end):
+    start, end = mod.compute_bounds(fixed_now, start_str=start_str, end_str=end_str)
+    assert start == exp_start
+    assert end == exp_end
 
-    # Normal explicit range
-    start, end = mod.compute_bounds(now, start_str="2025-10-10", end_str="2025-10-24")
-    assert start == datetime(2025, 10, 10, 0, 0, 0, tzinfo=mod.DEFAULT_TZ)
-    # end exclusive = 2025-10-25 00:00
-    assert end == datetime(2025, 10, 25, 0, 0, 0, tzinfo=mod.DEFAULT_TZ)
+
+def test_compute_bounds_is_memoized_per_calendar_day():
+    morning = _DT["2025-10-24"].replace(hour=8)
+    evening = _DT["2025-10-24"].replace(hour=23, minute=59)
+    assert mod.compute_bounds(morning, "", "") is mod.compute_bounds(evening, "", "")
+    # The open-ended default moves with the day
+    assert mod.compute_bounds(_DT["2025-10-25"], "", "")[1] == _DT["2025-10-26"]
 
 
 def test_default_out_name_pattern():
     name = mod.default_out_name()
     assert name.endswith(".xlsx")
-    # mJiraWorkLogExtractor-YYYY-MM-DD-HHMM.xlsx
-    m = re.match(r"^mJiraWorkLogExtractor-\d{4}-\d{2}-\d{2}-\d{4}\.xlsx$", name)
-    assert m is not None
+    assert _OUT_NAME_RE.match(name) is not None
 
 
 def test_jql_for_range_inclusive_bounds():
-    start = datetime(2025, 10, 1, 0, 0, tzinfo=mod.DEFAULT_TZ)
-    end = datetime(2025, 10, 25, 0, 0, tzinfo=mod.DEFAULT_TZ)  # exclusive
+    start = _DT["2025-10-01"]
+    end = _DT["2025-10-25"]  # exclusive
     jql = mod.jql_for_range(start, end)
     assert jql == 'worklogDate >= "2025-10-01" AND worklogDate <= "2025-10-24"'
 
 
-def test_numeric_only_various_inputs():
-    assert mod.numeric_only("SOW: 12345 ABC") == "12345"
-    assert mod.numeric_only("no-digits") == ""
-    assert mod.numeric_only("") == ""
+@pytest.mark.parametrize(
+    "s,expected",
+    [
+        ("SOW: 12345 ABC", "12345"),
+        ("no-digits", ""),
+        ("", ""),
+        ("4711", "4711"),
+        ("12\u00b2", "12"),
+    ],
+)
+def test_numeric_only(s, expected):
+    assert mod.numeric_only(s) == expected
 
 
-def test__best_label_and__flatten_hierarchy_and_stringify_sow():
-    # _best_label
-    assert mod._best_label({"value": "Alpha"}) == "Alpha"
-    assert mod._best_label({"name": "Beta"}) == "Beta"
-    assert mod._best_label({"label": "Gamma"}) == "Gamma"
-    assert mod._best_label({"title": "Delta"}) == "Delta"
-    assert mod._best_label({"key": "Epsilon"}) == "Epsilon"
-    assert mod._best_label({"id": 42}) == "42"
-    assert mod._best_label({}) == ""
+@pytest.mark.parametrize(
+    "payload,expected",
+    [
+        ({"value": "Alpha"}, "Alpha"),
+        ({"name": "Beta"}, "Beta"),
+        ({"label": "Gamma"}, "Gamma"),
+        ({"title": "Delta"}, "Delta"),
+        ({"key": "Epsilon"}, "Epsilon"),
+        ({"id": 42}, "42"),
+        ({}, ""),
+    ],
+)
+def test_best_label(payload, expected):
+    assert mod._best_label(payload) == expected
 
-    # _flatten_hierarchy with child
-    h = {"value": "Top", "child": {"value": "Mid", "child": {"value": "Leaf"}}}
-    assert mod._flatten_hierarchy(h) == ["Top", "Mid", "Leaf"]
 
-    # _flatten_hierarchy with children list
-    h2 = {"value": "Top", "children": [{"value": "Mid"}]}
-    assert mod._flatten_hierarchy(h2) == ["Top", "Mid"]
+@pytest.mark.parametrize(
+    "tree,expected",
+    [
+        ({"value": "Top", "child": {"value": "Mid", "child": {"value": "Leaf"}}}, ["Top", "Mid", "Leaf"]),
+        ({"value": "Top", "children": [{"value": "Mid"}]}, ["Top", "Mid"]),
+    ],
+    ids=["child", "children-list"],
+)
+def test_flatten_hierarchy(tree, expected):
+    assert mod._flatten_hierarchy(tree) == expected
+
 
-    # stringify_sow
-    assert mod.stringify_sow(None) == ""
-    assert mod.stringify_sow("ABC") == "ABC"
-    assert mod.stringify_sow(["A1", "B2"]) == "A1 | B2"
-    assert mod.stringify_sow({"value": "Top", "child": {"value": "Leaf"}}) == "Top:Leaf"
+@pytest.mark.parametrize(
+    "val,expected",
+    [
+        (None, ""),
+        ("ABC", "ABC"),
+        (["A1", "B2"], "A1 | B2"),
+        ({"value": "Top", "child": {"value": "Leaf"}}, "Top:Leaf"),
+        (["A1", ["", None, {"value": "Top"}], [[7]]], "A1 | Top | 7"),
+    ],
+)
+def test_stringify_sow(val, expected):
+    assert mod.stringify_sow(val) == expected
+
+
+# adf_to_text only reads its input, so one document is shared by every run.
+_SAMPLE_ADF = {
+    "type": "doc",
+    "content": [
+        {"type": "paragraph", "content": [{"type": "text", "text": "Hello"}]},
+        {
+            "type": "bulletList",
+            "content": [
+                {
+                    "type": "listItem",
+                    "content": [
+                        {"type": "paragraph", "content": [{"type": "text", "text": "Item1"}]}
+                    ],
+                },
+                {
+                    "type": "listItem",
+                    "content": [
+                        {"type": "paragraph", "content": [{"type": "text", "text": "Item2"}]}
+                    ],
+                },
+            ],
+        },
+    ],
+}
 
 
 def test_adf_to_text_paragraphs_and_list():
-    adf = {
-        "type": "doc",
-        "content": [
-            {"type": "paragraph", "content": [{"type": "text", "text": "Hello"}]},
-            {
-                "type": "bulletList",
-                "content": [
-                    {
-                        "type": "listItem",
-                        "content": [
-                            {"type": "paragraph", "content": [{"type": "text", "text": "Item1"}]}
-                        ],
-                    },
-                    {
-                        "type": "listItem",
-                        "content": [
-                            {"type": "paragraph", "content": [{"type": "text", "text": "Item2"}]}
-                        ],
-                    },
-                ],
-            },
-        ],
-    }
-    txt = mod.adf_to_text(adf)
-    # Expect "Hello" and list items prefixed with "- "
-    assert "Hello" in txt
-    assert "- Item1" in txt
-    assert "- Item2" in txt
-
-
-def test_vprint_only_when_verbose(capsys):
+    txt = mod.adf_to_text(_SAMPLE_ADF)
+    assert _ADF_EXPECT.search(txt) is not None
+
+
+def test_vprint_only_when_verbose(monkeypatch):
+    buf = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", buf)
     mod.vprint(True, "A", 123)
-    captured = capsys.readouterr()
-    assert "A 123" in captured.out
+    assert "A 123" in buf.getvalue()
 
+    buf.seek(0)
+    buf.truncate()
     mod.vprint(False, "B", 456)
-    captured = capsys.readouterr()
     # nothing new printed
-    assert captured.out == ""
+    assert buf.getvalue() == ""
+
+
+def test_adf_to_text_deep_nesting_does_not_recurse():
+    node = {"type": "paragraph", "content": [{"type": "text", "text": "fundo"}]}
+    for _ in range(5000):
+        node = {"type": "bulletList", "content": [{"type": "listItem", "content": [node]}]}
+    text = mod._adf_walk({"type": "doc", "content": [node]})
+    assert text == "- " * 5000 + "fundo"
@@ -0,0 +1,126 @@
+import sys
+import threading
+import zipfile
+from types import SimpleNamespace
+
+import openpyxl
+import pytest
+
+import mJiraWorkLogExtractor as mod
+
+
+def test_write_xlsx_streaming_round_trip(tmp_path):
+    out = tmp_path / "out.xlsx"
+    rows = [("P", "K-1", 1.5), ("Q", "K-2", 0.25)]
+    mod.write_xlsx_streaming(str(out), ["Projeto", "Clave", "Horas"], iter(rows))
+
+    wb = openpyxl.load_workbook(out, read_only=True)
+    ws = wb["Relatório"]
+    values = [tuple(r) for r in ws.iter_rows(values_only=True)]
+    wb.close()
+    assert values[0] == ("Projeto", "Clave", "Horas")
+    assert values[1:] == rows
+
+
+def test_write_xlsx_streaming_header_is_bold(tmp_path):
+    out = tmp_path / "out.xlsx"
+    mod.write_xlsx_streaming(str(out), ["Projeto", "Horas"], [("P", 1.0)])
+
+    ws = openpyxl.load_workbook(out)["Relatório"]
+    assert [c.font.bold for c in ws[1]] == [True, True]
+    assert [bool(c.font.bold) for c in ws[2]] == [False, False]
+
+
+def test_main_writes_real_full_and_short_files(monkeypatch, tmp_path, tmp_config_file):
+    out_file = tmp_path / "report.xlsx"
+    monkeypatch.setattr(mod, "parse_args", lambda: SimpleNamespace(
+        config=str(tmp_config_file), out=str(out_file), verbose=False,
+        max_workers=1, timeout=5, insecure=False, sow_field_id="",
+    ))
+    monkeypatch.setattr(mod, "ensure_field_exists", lambda *a, **k: False)
+    monkeypatch.setattr(mod, "post_search_jql", lambda *a, **k: [{"key": "K-1", "fields": {}}])
+    row = {
+        "Projeto": "P", "Tipo de Problema": "T", "Clave": "K-1", "Resumo": "S", "Prioridade": "M",
+        "SoW": "7", "Data de Início": "2025-10-24", "Nome de Exibição": "U", "Tempo Gasto (h)": 1.0,
+        "Descrição do Trabalho": "D",
+    }
+    monkeypatch.setattr(mod, "fetch_worklogs_for_issue", lambda *a, **k: [tuple(row[c] for c in mod.COLS)])
+
+    mod.main()
+
+    wb = openpyxl.load_workbook(tmp_path / "report_short.xlsx", read_only=True)
+    values = [tuple(r) for r in wb["Relatório"].iter_rows(values_only=True)]
+    wb.close()
+    assert values[0] == tuple(mod.SHORT_COLS)
+    assert values[1] == ("P", "K-1", "S", "7", "2025-10-24", "U", 1.0)
+
+
+def test_write_xlsx_streaming_uses_requested_compresslevel(tmp_path):
+    rows = [("P", f"K-{i}", "texto repetido " * 20) for i in range(500)]
+    fast, small = tmp_path / "fast.xlsx", tmp_path / "small.xlsx"
+    mod.write_xlsx_streaming(str(fast), ["Projeto", "Clave", "Resumo"], rows, compresslevel=1)
+    mod.write_xlsx_streaming(str(small), ["Projeto", "Clave", "Resumo"], rows, compresslevel=9)
+
+    with zipfile.ZipFile(fast) as zf:
+        assert zf.testzip() is None
+        assert all(i.compress_type == zipfile.ZIP_DEFLATED for i in zf.infolist())
+    assert small.stat().st_size <= fast.stat().st_size
+
+    wb = openpyxl.load_workbook(fast, read_only=True)
+    assert sum(1 for _ in wb["Relatório"].iter_rows()) == len(rows) + 1
+    wb.close()
+
+
+def test_write_xlsx_streaming_prefers_xlsxwriter_when_installed(monkeypatch, tmp_path):
+    log = []
+
+    class FakeWorksheet:
+        def write_row(self, r, c, data, fmt=None):
+            log.append(("row", r, c, tuple(data), fmt))
+
+    class FakeWorkbook:
+        def __init__(self, path, options):
+            log.append(("open", path, options))
+
+        def add_worksheet(self, name):
+            log.append(("sheet", name))
+            return FakeWorksheet()
+
+        def add_format(self, props):
+            return props
+
+        def close(self):
+            log.append(("close",))
+
+    monkeypatch.setitem(sys.modules, "xlsxwriter", SimpleNamespace(Workbook=FakeWorkbook))
+    out = str(tmp_path / "short.xlsx")
+    mod.write_xlsx_streaming(out, ["Projeto", "Horas"], iter([("P", 1.0), ("Q", 2.0)]), prefer_xlsxwriter=True)
+
+    assert log == [
+        ("open", out, {"constant_memory": True, "strings_to_urls": False}),
+        ("sheet", "Relatório"),
+        ("row", 0, 0, ("Projeto", "Horas"), {"bold": True}),
+        ("row", 1, 0, ("P", 1.0), None),
+        ("row", 2, 0, ("Q", 2.0), None),
+        ("close",),
+    ]
+
+
+def test_write_xlsx_streaming_falls_back_to_openpyxl_without_xlsxwriter(monkeypatch, tmp_path):
+    monkeypatch.setitem(sys.modules, "xlsxwriter", None)
+    out = tmp_path / "short.xlsx"
+    mod.write_xlsx_streaming(str(out), ["Projeto"], [("P",)], prefer_xlsxwriter=True)
+    ws = openpyxl.load_workbook(out)["Relatório"]
+    assert [c.value for c in ws[2]] == ["P"]
+
+
+def test_write_reports_concurrently_runs_both_and_reraises_short_failure():
+    seen = []
+
+    def short_fails():
+        seen.append(("short", threading.current_thread().name))
+        raise OSError("disco cheio")
+
+    with pytest.raises(OSError, match="disco cheio"):
+        mod._write_reports_concurrently(lambda: seen.append(("full", threading.current_thread().name)), short_fails)
+    assert sorted(seen) == [("full", threading.main_thread().name), ("short", "xlsx-short")]